@@ -8,9 +8,92 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, NoSuchElementException
+from collections import namedtuple
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+import atexit
+import os
 import time
+import re
 from datetime import datetime
 
+# Default for AtriaDataExtractor(debug=...): step-by-step and per-row/per-cell diagnostics.
+# Set ATRIA_DEBUG=1 in the environment to enable them.
+DEBUG = os.getenv("ATRIA_DEBUG", "0") not in ("", "0")
+
+# Keep the runner's browser open between run_add_tracker_report calls in this process
+# (e.g. a scheduler running only this report); set ATRIA_KEEP_BROWSER=1 to enable.
+# Off by default: the other reports start Chrome on the same profile and debugging port
+# and kill any running instance.
+KEEP_BROWSER = os.getenv("ATRIA_KEEP_BROWSER", "0") not in ("", "0")
+
+
+# Calendar header parsing (e.g. "Dec 2025" / "December 2025")
+_MONTH_ABBRS = ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec')
+_MONTH_NUMBERS = {abbr: number for number, abbr in enumerate(_MONTH_ABBRS, 1)}
+_MONTH_RE = re.compile(r'\b(' + '|'.join(_MONTH_ABBRS) + r')', re.I)
+_YEAR_RE = re.compile(r'20\d{2}')
+
+# Numbers in card text (e.g. ROAS "2.12", spend "1500")
+_NUM_RE = re.compile(r'\d+\.?\d*')
+
+# Landing page cells: the URL is followed by "Used in X ads" and/or further lines
+_LP_CLEAN = re.compile(r'Used in|\n')
+
+# Filter popup: operator dropdown label, and the "does not contain" option
+# (the .pattern strings are also evaluated browser-side)
+_OPERATOR_RE = re.compile(r'contain|equal|match|does|is', re.I)
+_NOT_CONTAIN_RE = re.compile(r"does not contain|doesn't contain|not contain", re.I)
+
+
+def _clean_landing_page(text):
+    """Return the landing page text up to the first "Used in" or line break."""
+    return _LP_CLEAN.split(text.strip(), 1)[0].strip() if text else text
+
+
+def _parse_month_year(text):
+    """
+    Parse a calendar header text into (month_number, year).
+
+    Returns:
+        tuple: (month or None, year or None)
+    """
+    month_match = _MONTH_RE.search(text)
+    year_match = _YEAR_RE.search(text)
+    return (
+        _MONTH_NUMBERS[month_match.group(1).lower()] if month_match else None,
+        int(year_match.group()) if year_match else None,
+    )
+
+
+# Target date fields and display strings, formatted once per set_date call
+_TargetDate = namedtuple('_TargetDate', 'day month year month_abbr display iso')
+
+
+def _to_target_date(date_obj):
+    """Pre-compute the parts of a datetime that the calendar code needs."""
+    return _TargetDate(
+        day=date_obj.day,
+        month=date_obj.month,
+        year=date_obj.year,
+        month_abbr=date_obj.strftime('%b'),  # e.g., 'Dec'
+        display=date_obj.strftime('%d-%b-%Y'),
+        iso=date_obj.strftime('%Y-%m-%d'),
+    )
+
+
+@lru_cache(maxsize=256)
+def _row_cells_locator(row_index):
+    """Locator for the cells of one AG Grid body row across all column containers."""
+    return (By.CSS_SELECTOR, ", ".join(
+        f"{container} .ag-row[row-index='{row_index}'] .ag-cell[col-id]"
+        for container in (".ag-pinned-left-cols-container", ".ag-center-cols-container",
+                          ".ag-pinned-right-cols-container")
+    ))
+
 
 class AtriaDataExtractor:
     """Extract landing page performance data from Atria Analytics."""
@@ -21,15 +104,191 @@ class AtriaDataExtractor:
     # Second report URL
     ATRIA_URL_2 = "https://app.tryatria.com/workspace/analytics/facebook/7c70f57b653f41c0a081781619884f33/report/97eca273cb9e431db7d90271eb87f047"
 
-    def __init__(self, driver):
+    # URL fragments that indicate the login/auth flow
+    LOGIN_URL_KEYWORDS = ("login", "sign", "auth")
+
+    # Calendar header (month/year) of the picker panels
+    HEADER_SELECTOR = ".ant-picker-header-view, .ant-picker-panel-header"
+
+    # Month navigation buttons, most specific first
+    NEXT_SELECTORS = (
+        ".ant-picker-header-next-btn",
+        "button.ant-picker-header-next-btn",
+        ".ant-picker-header button[class*='next']",
+        "button[aria-label*='next']",
+        "button[aria-label*='Next']",
+    )
+    PREV_SELECTORS = (
+        ".ant-picker-header-prev-btn",
+        "button.ant-picker-header-prev-btn",
+        ".ant-picker-header button[class*='prev']",
+        "button[aria-label*='prev']",
+        "button[aria-label*='Prev']",
+    )
+
+    def __init__(self, driver, debug=None):
         """
         Initialize the extractor.
 
         Args:
             driver: Selenium WebDriver instance
+            debug: Print per-element diagnostics (costs extra WebDriver round-trips);
+                defaults to the module-level DEBUG flag
         """
         self.driver = driver
+        self.debug = DEBUG if debug is None else debug
         self.wait = WebDriverWait(driver, 30)
+        # Landmark elements (date picker, filter/apply buttons) reused across calls;
+        # cleared on every page navigation
+        self._element_cache = {}
+        # Non-table data layout found by the last successful extract_table_data
+        # ({'kind': 'ag-grid'|'cards'}); both reports share the page schema, so the
+        # next report can skip table scoring and detection
+        self._table_strategy = None
+
+    def _cached(self, key, locate):
+        """
+        Return a cached landmark element, re-locating it if missing or stale.
+
+        Args:
+            key: Cache key (e.g. 'date_picker')
+            locate: Callable returning the element or None
+
+        Returns:
+            WebElement or None
+        """
+        element = self._element_cache.get(key)
+        if element is not None:
+            try:
+                element.is_enabled()  # raises once the element is detached from the DOM
+                return element
+            except StaleElementReferenceException:
+                pass
+
+        element = locate()
+        if element is not None:
+            self._element_cache[key] = element
+        else:
+            self._element_cache.pop(key, None)
+        return element
+
+    def _dbg(self, message):
+        """Print a step-by-step diagnostic message when debug output is enabled."""
+        if self.debug:
+            print(message)
+
+    @contextmanager
+    def _no_implicit_wait(self):
+        """
+        Temporarily disable the driver's implicit wait, so each failed lookup in a fallback
+        chain returns immediately instead of blocking for the implicit timeout.
+        """
+        previous = self.driver.timeouts.implicit_wait
+        if previous:
+            self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            if previous:
+                self.driver.implicitly_wait(previous)
+
+    def _fast_click(self, element):
+        """
+        Click an element via JavaScript, skipping WebDriver's visibility/scroll checks.
+        Only use for elements already known to be visible and enabled.
+        """
+        self.driver.execute_script("arguments[0].click();", element)
+
+    def _scroll_into_view(self, element):
+        """
+        Scroll an element to the middle of the viewport (instantly) unless it is already
+        fully on screen.
+
+        Returns:
+            bool: True if the page was scrolled
+        """
+        return self.driver.execute_script("""
+            var r = arguments[0].getBoundingClientRect();
+            if (r.top >= 0 && r.bottom <= window.innerHeight) return false;
+            arguments[0].scrollIntoView({block: 'center'});
+            return true;
+        """, element)
+
+    def _wait_until(self, condition, timeout=10):
+        """
+        Poll a condition until it is truthy or the timeout expires.
+
+        Args:
+            condition: Expected condition (callable taking the driver)
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            The condition's result, or None if it timed out
+        """
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(condition)
+        except TimeoutException:
+            return None
+
+    def _wait_visible(self, selector, timeout=10):
+        """
+        Wait for an element matching a CSS selector to become visible.
+
+        Returns:
+            WebElement, or None if it did not appear within the timeout
+        """
+        return self._wait_until(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, selector)), timeout
+        )
+
+    # JavaScript returning the first visible element matching a CSS selector whose
+    # rendered text matches an optional case-insensitive regex (or null)
+    _JS_FIND_VISIBLE = """
+    var pattern = arguments[1] ? new RegExp(arguments[1], 'i') : null;
+    var nodes = document.querySelectorAll(arguments[0]);
+    for (var i = 0; i < nodes.length; i++) {
+        var e = nodes[i];
+        if (e.offsetParent !== null && (!pattern || pattern.test(e.innerText || ''))) return e;
+    }
+    return null;
+    """
+
+    def _find_visible(self, selector, text_pattern=None):
+        """
+        Find the first visible element for a CSS selector in a single round-trip.
+
+        Args:
+            selector: CSS selector
+            text_pattern: Optional regex (case-insensitive) the element text must match
+
+        Returns:
+            WebElement or None
+        """
+        return self.driver.execute_script(self._JS_FIND_VISIBLE, selector, text_pattern)
+
+    # JavaScript returning the element owning the first visible text node that matches a
+    # case-insensitive regex (the JS equivalent of XPath contains(text(), ...)), or null
+    _JS_FIND_VISIBLE_TEXT = """
+    var pattern = new RegExp(arguments[0], 'i');
+    var walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    for (var node = walker.nextNode(); node; node = walker.nextNode()) {
+        var e = node.parentElement;
+        if (e && e.offsetParent !== null && pattern.test(node.nodeValue)) return e;
+    }
+    return null;
+    """
+
+    def _find_visible_text(self, text_pattern):
+        """
+        Find the visible element whose own text matches a regex, in a single round-trip.
+
+        Args:
+            text_pattern: Regex (case-insensitive) matched against each text node
+
+        Returns:
+            WebElement or None
+        """
+        return self.driver.execute_script(self._JS_FIND_VISIBLE_TEXT, text_pattern)
 
     def navigate_to_report(self, report_num=1):
         """
@@ -45,289 +304,458 @@ class AtriaDataExtractor:
             url = self.ATRIA_URL
             print(f"[NAV] Navigating to Atria report 1...")
 
+        self._element_cache.clear()
         self.driver.get(url)
-        time.sleep(5)
 
-    def check_and_wait_for_login(self):
-        """Check if login is required and wait for user to login."""
-        # Check if we're on a login page
-        current_url = self.driver.current_url.lower()
+        self._wait_for_report_ready()
+
+        # Warm the browser cache for report 2 while report 1 is being worked on
+        if report_num != 2 and not self._on_login_page():
+            self._prefetch(self.ATRIA_URL_2)
 
-        if "login" in current_url or "sign" in current_url or "auth" in current_url:
+    def open_report_tab(self, report_num):
+        """
+        Start loading a report in a new background tab and return to the current tab.
+
+        The navigation is started from script so it does not block; the report loads
+        while the current tab is being worked on. Use switch_to_report_tab to continue there.
+
+        Args:
+            report_num: 1 for first report, 2 for second report
+
+        Returns:
+            str: Window handle of the new tab, or None if it could not be opened
+        """
+        url = self.ATRIA_URL_2 if report_num == 2 else self.ATRIA_URL
+        current = self.driver.current_window_handle
+        try:
+            self.driver.switch_to.new_window('tab')
+            handle = self.driver.current_window_handle
+            self.driver.execute_script("window.location.href = arguments[0];", url)
+            print(f"[NAV] Loading Atria report {report_num} in a background tab...")
+            return handle
+        except Exception as e:
+            print(f"[NAV] Could not open report {report_num} tab: {e}")
+            return None
+        finally:
+            self.driver.switch_to.window(current)
+
+    def switch_to_report_tab(self, handle):
+        """
+        Switch to a tab opened with open_report_tab and wait until its date picker is ready.
+
+        Args:
+            handle: Window handle returned by open_report_tab
+        """
+        self._element_cache.clear()
+        self.driver.switch_to.window(handle)
+        self._wait_for_report_ready()
+
+    def _wait_for_report_ready(self, timeout=30):
+        """
+        Wait for the date picker to become interactive (or for a login redirect)
+        instead of a fixed sleep.
+        """
+        self._wait_until(EC.any_of(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, ".ant-picker.ant-picker-range")),
+            self._on_login_page,
+        ), timeout=timeout)
+
+    def _prefetch(self, url):
+        """Ask the browser to prefetch a URL in the background (<link rel=prefetch>)."""
+        try:
+            self.driver.execute_script("""
+                var link = document.createElement('link');
+                link.rel = 'prefetch';
+                link.href = arguments[0];
+                document.head.appendChild(link);
+            """, url)
+        except Exception as e:
+            print(f"[NAV] Prefetch failed: {e}")
+
+    def _on_login_page(self, driver=None):
+        """Return True if the current URL looks like a login/auth page."""
+        current_url = (driver or self.driver).current_url.lower()
+        return any(keyword in current_url for keyword in self.LOGIN_URL_KEYWORDS)
+
+    def check_and_wait_for_login(self, report_num=1):
+        """
+        Check if login is required and wait for user to login.
+
+        Args:
+            report_num: Report to navigate to once login completes
+        """
+        # Check if we're on a login page
+        if self._on_login_page():
             print("\n" + "=" * 60)
             print("LOGIN REQUIRED")
             print("=" * 60)
             print("Please login to Atria in the browser window...")
             print("=" * 60 + "\n")
 
-            # Wait for login to complete (URL should change)
-            max_wait = 300  # 5 minutes
-            start_time = time.time()
-
-            while time.time() - start_time < max_wait:
-                current_url = self.driver.current_url.lower()
-                if "login" not in current_url and "sign" not in current_url and "auth" not in current_url:
-                    print("Login successful!")
-                    time.sleep(3)
-                    # Navigate to report after login
-                    self.navigate_to_report()
-                    return True
-                time.sleep(2)
+            # Wait for login to complete (URL should change), up to 5 minutes
+            try:
+                WebDriverWait(self.driver, 300, poll_frequency=0.5).until(
+                    lambda d: not self._on_login_page(d)
+                )
+            except TimeoutException:
+                print("Login timeout!")
+                return False
 
-            print("Login timeout!")
-            return False
+            print("Login successful!")
+            # Navigate to report after login (waits for the page to render)
+            self.navigate_to_report(report_num)
+            return True
 
         return True
 
-    def set_date(self, target_date):
+    # Date picker lookup strategies, in order of preference
+    DATE_PICKER_SELECTORS = (
+        ".ant-picker.ant-picker-range",        # Ant Design range picker (most reliable)
+        "input[date-range='start']",           # start input of the range
+        "div[class*='picker'][class*='range']",  # any picker/range container near the top
+        "input[placeholder*='date' i]",        # input with a date placeholder
+    )
+
+    # JavaScript returning the first visible match across the strategies (resolved to its
+    # .ant-picker container), or null. Generic picker divs must sit in the top 300px.
+    _JS_FIND_DATE_PICKER = """
+    var selectors = arguments[0];
+    for (var s = 0; s < selectors.length; s++) {
+        var nodes = document.querySelectorAll(selectors[s]);
+        for (var i = 0; i < nodes.length; i++) {
+            var e = nodes[i];
+            if (e.offsetParent === null) continue;
+            if (s === 2 && e.getBoundingClientRect().top + window.scrollY >= 300) continue;
+            return {element: e.closest('.ant-picker') || e, strategy: s + 1};
+        }
+    }
+    return null;
+    """
+
+    def _locate_date_picker(self):
         """
-        Set the date in the date picker.
-        The date picker is an Ant Design range picker, so we need to click the same date twice.
+        Locate the Ant Design range picker, trying every strategy in one round-trip.
+
+        Returns:
+            WebElement or None
+        """
+        match = self.driver.execute_script(self._JS_FIND_DATE_PICKER, list(self.DATE_PICKER_SELECTORS))
+        if not match:
+            return None
+        self._dbg(f"[DATE] Found date picker (strategy {match['strategy']})")
+        return match['element']
+
+    # Unambiguous formats the range picker inputs may display a date in
+    PICKER_INPUT_FORMATS = ('%Y-%m-%d', '%d-%b-%Y', '%b %d, %Y', '%d %b %Y', '%Y/%m/%d')
+
+    # JavaScript returning the range picker input values plus every selected, range-start or
+    # range-end in-view day cell across all calendar panels, each with its panel's header
+    # text (panels stay in the DOM once opened; wrapper panels holding nested ones are skipped)
+    _JS_DATE_STATE = """
+    var values = Array.from(document.querySelectorAll('.ant-picker.ant-picker-range input'))
+        .map(function(i) { return i.value.trim(); });
+    var marked = [];
+    document.querySelectorAll('.ant-picker-dropdown .ant-picker-panel').forEach(function(panel) {
+        if (panel.querySelector('.ant-picker-panel')) return;
+        var header = panel.querySelector('.ant-picker-header-view');
+        panel.querySelectorAll('td.ant-picker-cell-in-view').forEach(function(td) {
+            if (/ant-picker-cell-(selected|range-start|range-end)\\b/.test(td.className)) {
+                marked.push({day: td.textContent.trim(), header: header ? header.textContent : ''});
+            }
+        });
+    });
+    return {values: values, marked: marked};
+    """
+
+    def _parse_picker_input(self, value):
+        """
+        Parse a range picker input value with PICKER_INPUT_FORMATS.
 
         Args:
-            target_date: datetime object for the date to select
+            value: Input value (may be empty)
+
+        Returns:
+            tuple: (format, (year, month, day)) for the first matching format,
+                or (None, None) if no format matches
         """
-        print(f"[DATE] Setting date to {target_date.strftime('%d-%b-%Y')}...")
+        for fmt in self.PICKER_INPUT_FORMATS:
+            try:
+                parsed = datetime.strptime(value.strip(), fmt)
+            except ValueError:
+                continue
+            return fmt, (parsed.year, parsed.month, parsed.day)
+        return None, None
+
+    def _is_date_already_selected(self, target):
+        """
+        Check in one round-trip whether the picker's range is already target..target.
+
+        The range inputs decide whenever both can be parsed; the calendar panels are only
+        consulted when they cannot.
 
+        Args:
+            target: _TargetDate for the date to select
+
+        Returns:
+            bool: True if both ends of the range already equal the target date
+        """
         try:
-            # Wait for page to load
-            time.sleep(3)
+            state = self.driver.execute_script(self._JS_DATE_STATE) or {}
+        except Exception:
+            return False
 
-            # Find the Ant Design date picker
-            # It has class "ant-picker ant-picker-range"
-            date_picker = None
+        # Range inputs (start, end): both must be the target date
+        values = state.get('values', [])
+        if len(values) == 2:
+            parsed = [self._parse_picker_input(v)[1] for v in values]
+            if all(parsed):
+                return all(p == (target.year, target.month, target.day) for p in parsed)
+
+        # Calendar panels: exactly one marked cell (a one-day range), on the target day
+        # in a panel showing the target month
+        marked = state.get('marked', [])
+        return (
+            len(marked) == 1
+            and marked[0]['day'] == str(target.day)
+            and _parse_month_year(marked[0]['header']) == (target.month, target.year)
+        )
 
-            # Strategy 1: Find by Ant Design class (most reliable)
-            print("[DATE] Looking for ant-picker-range...")
-            try:
-                date_picker = self.driver.find_element(By.CSS_SELECTOR, ".ant-picker.ant-picker-range")
-                print(f"[DATE] Found ant-picker-range: displayed={date_picker.is_displayed()}")
-            except Exception as e:
-                print(f"[DATE] ant-picker-range not found: {e}")
+    def set_date(self, target_date):
+        """
+        Set the date in the date picker.
+        The date picker is an Ant Design range picker, so the same date is used for both ends:
+        typed into the start/end inputs, or clicked twice in the calendar if typing fails.
 
-            # Strategy 2: Find by the input with date-range attribute
-            if not date_picker:
-                print("[DATE] Looking for input with date-range attribute...")
-                try:
-                    start_input = self.driver.find_element(By.CSS_SELECTOR, "input[date-range='start']")
-                    print(f"[DATE] Found start input: value={start_input.get_attribute('value')}")
-                    # Get the parent picker container
-                    date_picker = start_input.find_element(By.XPATH, "./ancestor::div[contains(@class, 'ant-picker')]")
-                    print(f"[DATE] Found parent picker")
-                except Exception as e:
-                    print(f"[DATE] input date-range not found: {e}")
+        Args:
+            target_date: datetime object for the date to select
+        """
+        target = _to_target_date(target_date)
+        print(f"[DATE] Setting date to {target.display}...")
 
-            # Strategy 3: Find by class containing 'picker' and 'range'
-            if not date_picker:
-                print("[DATE] Looking for div with picker class...")
-                try:
-                    pickers = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'picker') and contains(@class, 'range')]")
-                    print(f"[DATE] Found {len(pickers)} picker elements")
-                    for i, p in enumerate(pickers):
-                        try:
-                            print(f"[DATE]   Picker {i}: displayed={p.is_displayed()}, y={p.location['y']}, class={p.get_attribute('class')[:50]}")
-                            if p.is_displayed() and p.location['y'] < 300:
-                                date_picker = p
-                                break
-                        except Exception as e:
-                            print(f"[DATE]   Picker {i} error: {e}")
-                except Exception as e:
-                    print(f"[DATE] picker class search failed: {e}")
+        try:
+            # Wait for the date picker to render
+            self._wait_visible(".ant-picker.ant-picker-range")
 
-            # Strategy 4: Find input with placeholder containing 'date'
-            if not date_picker:
-                print("[DATE] Looking for input with date placeholder...")
-                try:
-                    inputs = self.driver.find_elements(By.XPATH, "//input[contains(@placeholder, 'date') or contains(@placeholder, 'Date')]")
-                    print(f"[DATE] Found {len(inputs)} date inputs")
-                    for inp in inputs:
-                        try:
-                            if inp.is_displayed():
-                                print(f"[DATE]   Input: placeholder={inp.get_attribute('placeholder')}, value={inp.get_attribute('value')}")
-                                date_picker = inp
-                                break
-                        except:
-                            continue
-                except Exception as e:
-                    print(f"[DATE] placeholder search failed: {e}")
+            # Nothing to do if the report already shows exactly this date
+            if self._is_date_already_selected(target):
+                print(f"[DATE] {target.display} is already selected, skipping date picker")
+                return
+
+            date_picker = self._cached('date_picker', self._locate_date_picker)
 
             if date_picker:
-                print(f"[DATE] Clicking date picker...")
+                self._dbg(f"[DATE] Clicking date picker...")
                 try:
                     date_picker.click()
-                    print("[DATE] Click successful")
+                    self._dbg("[DATE] Click successful")
                 except Exception as e:
                     print(f"[DATE] Direct click failed: {e}, trying JavaScript click...")
                     self.driver.execute_script("arguments[0].click();", date_picker)
-                    print("[DATE] JavaScript click executed")
+                    self._dbg("[DATE] JavaScript click executed")
+
+                # Wait for the calendar popup to open
+                self._wait_visible(".ant-picker-dropdown:not(.ant-picker-dropdown-hidden)", timeout=5)
 
-                time.sleep(2)
+                # Type the date into the range inputs; fall back to clicking through the calendar
+                if self._type_date_range(target_date):
+                    print(f"[DATE] Typed {target.display} into the range inputs")
+                    return
 
-                # Now we need to select the date in the calendar
-                self._select_date_in_calendar(target_date)
+                print("[DATE] Typed date was not accepted, selecting it in the calendar...")
+                if not self.driver.find_elements(By.CSS_SELECTOR, ".ant-picker-dropdown:not(.ant-picker-dropdown-hidden)"):
+                    self._fast_click(date_picker)
+                    self._wait_visible(".ant-picker-dropdown:not(.ant-picker-dropdown-hidden)", timeout=5)
+                self._select_date_in_calendar(target)
             else:
                 print("[DATE] ERROR: Could not find date picker element")
-                # Debug: print all visible elements with their classes
-                print("[DATE] Debugging - looking for all potential picker elements...")
-                try:
-                    all_divs = self.driver.find_elements(By.XPATH, "//div[@class]")
-                    for div in all_divs[:50]:  # Check first 50
-                        try:
-                            cls = div.get_attribute('class')
-                            if 'picker' in cls.lower() or 'date' in cls.lower() or 'calendar' in cls.lower():
-                                print(f"[DATE]   Found: class='{cls[:60]}', y={div.location['y']}")
-                        except:
-                            continue
-                except:
-                    pass
+                if self.debug:
+                    # Debug: print all visible elements with their classes
+                    print("[DATE] Debugging - looking for all potential picker elements...")
+                    try:
+                        candidates = self.driver.execute_script("""
+                            return Array.from(document.querySelectorAll(
+                                "div[class*='picker' i], div[class*='date' i], div[class*='calendar' i]"
+                            )).slice(0, 50).map(function(div) {
+                                return {cls: div.className, y: Math.round(div.getBoundingClientRect().top + window.scrollY)};
+                            });
+                        """) or []
+                        for div in candidates:
+                            print(f"[DATE]   Found: class='{div['cls'][:60]}', y={div['y']}")
+                    except:
+                        pass
 
         except Exception as e:
             print(f"[DATE] Error setting date: {e}")
             import traceback
             traceback.print_exc()
 
-    def _select_date_in_calendar(self, target_date):
+    def _type_date_range(self, target_date):
         """
-        Select a specific date in the Ant Design calendar popup.
-        Since it's a range picker, click the same date twice in the same month.
+        Set the range to target..target by typing into the picker's start and end inputs,
+        skipping month navigation and day clicks entirely.
 
         Args:
-            target_date: datetime object
+            target_date: datetime object for the date to select
+
+        Returns:
+            bool: True if both inputs show the target date afterwards
         """
         try:
-            print(f"[CALENDAR] Selecting date: {target_date.strftime('%Y-%m-%d')}")
-            time.sleep(2)
-
-            target_day = target_date.day
-            target_month = target_date.month
-            target_year = target_date.year
-            target_month_name = target_date.strftime('%b')  # e.g., 'Dec'
-            target_month_full = target_date.strftime('%B')  # e.g., 'December'
-
-            print(f"[CALENDAR] Target: day={target_day}, month={target_month_name} ({target_month}), year={target_year}")
-
-            # First, navigate to the correct month/year
-            self._navigate_to_month(target_month, target_year)
-
-            time.sleep(1)
-
-            # Now find and click the target day TWICE in the LEFT calendar (same month)
-            print("[CALENDAR] Looking for calendar day cells...")
-
-            day_cells = []
-
-            # Find all day cells - use the inner element for clicking
-            try:
-                day_cells = self.driver.find_elements(By.CSS_SELECTOR, ".ant-picker-cell .ant-picker-cell-inner")
-                print(f"[CALENDAR] Found {len(day_cells)} day cell elements")
-            except Exception as e:
-                print(f"[CALENDAR] CSS selector failed: {e}")
-
-            if not day_cells:
-                try:
-                    day_cells = self.driver.find_elements(By.CSS_SELECTOR, "td.ant-picker-cell")
-                    print(f"[CALENDAR] Found {len(day_cells)} TD cells")
-                except:
-                    pass
+            inputs = self.driver.find_elements(By.CSS_SELECTOR, ".ant-picker.ant-picker-range input")
+            if len(inputs) < 2:
+                return False
+            start, end = inputs[0], inputs[1]
+
+            # Type in the same format the picker displays, so it parses what we enter
+            fmt = self._parse_picker_input(start.get_attribute('value') or '')[0] or '%Y-%m-%d'
+            text = target_date.strftime(fmt)
+            self._dbg(f"[DATE] Typing '{text}' into the range inputs...")
+
+            # Select the current value from script (Ctrl+A is Cmd+A on macOS), so typing replaces it
+            self.driver.execute_script("arguments[0].select();", start)
+            start.send_keys(text, Keys.TAB)
+            self.driver.execute_script("arguments[0].select();", end)
+            end.send_keys(text, Keys.ENTER)
+
+            # The popup closes once the range is complete
+            self._wait_until(EC.invisibility_of_element_located(
+                (By.CSS_SELECTOR, ".ant-picker-dropdown:not(.ant-picker-dropdown-hidden)")
+            ), timeout=3)
+
+            # Both ends must parse to the typed date (the picker may reformat it,
+            # e.g. 'Dec 01, 2025' is displayed as 'Dec 1, 2025')
+            values = self.driver.execute_script(
+                "return [arguments[0].value, arguments[1].value];", start, end
+            ) or []
+            expected = (target_date.year, target_date.month, target_date.day)
+            return len(values) == 2 and all(self._parse_picker_input(v)[1] == expected for v in values)
+        except Exception as e:
+            self._dbg(f"[DATE] Typing the date failed: {e}")
+            return False
 
-            # Find cells with our target day number in the LEFT calendar (first/start calendar)
-            print(f"[CALENDAR] Searching for day {target_day} in left calendar...")
-            target_cells = []
+    # Selectable day cells: in the displayed month and not disabled. The CSS engine drops
+    # greyed-out days from adjacent months and out-of-range days before they reach Python.
+    DAY_CELL_SELECTOR = "td.ant-picker-cell-in-view:not(.ant-picker-cell-disabled) .ant-picker-cell-inner"
+
+    # Left (start) panel of the range picker; v5 wraps panels in plain divs, v4 does not
+    LEFT_PANEL_SELECTOR = ".ant-picker-panels > div:first-child, .ant-picker-panel-container .ant-picker-panel:first-child"
+
+    # JavaScript finding a day in the first visible left panel (falls back to the whole
+    # document if no panel can be found). Returns {element, texts}: the visible selectable
+    # cell whose text is the day (or null) and the texts of all visible selectable cells.
+    _JS_FIND_DAY = """
+    var day = String(arguments[2]);
+    var panels = document.querySelectorAll(arguments[1]);
+    var scope = document;
+    for (var i = 0; i < panels.length; i++) {
+        if (panels[i].offsetParent !== null) { scope = panels[i]; break; }
+    }
+    var result = {element: null, texts: []};
+    scope.querySelectorAll(arguments[0]).forEach(function(inner) {
+        if (inner.offsetParent === null) return;
+        var text = inner.textContent.trim();
+        result.texts.push(text);
+        if (!result.element && text === day) result.element = inner;
+    });
+    return result;
+    """
 
-            # First, find the boundary between left and right calendars
-            # Get all cells and find the middle X position
-            all_x_positions = []
-            for cell in day_cells:
-                try:
-                    if cell.is_displayed():
-                        all_x_positions.append(cell.location['x'])
-                except:
-                    continue
+    # Async JavaScript clicking a day cell twice: once for the range start and, after the
+    # picker has re-rendered the cell (max ~1s), once for the range end. The second click
+    # must wait for that re-render, or Ant treats it as a new start. The cell may already
+    # be marked range start/selected before the first click (the target day ends the
+    # current range), so the wait is for its classes to change, always yielding at least
+    # one tick.
+    _JS_DOUBLE_CLICK_DAY = """
+    var cell = arguments[0], done = arguments[arguments.length - 1];
+    var td = cell.closest('td');
+    var before = td ? td.className : '';
+    var started = function() {
+        return !!td && td.className !== before && /ant-picker-cell-(range-start|selected)/.test(td.className);
+    };
+    cell.click();
+    var tries = 0;
+    var second = function() {
+        if (started() || !cell.isConnected || ++tries > 40) {
+            if (cell.isConnected) cell.click();
+            done(true);
+            return;
+        }
+        setTimeout(second, 25);
+    };
+    setTimeout(second, 0);
+    """
 
-            if all_x_positions:
-                min_x = min(all_x_positions)
-                max_x = max(all_x_positions)
-                mid_x = (min_x + max_x) / 2
-                print(f"[CALENDAR] X range: {min_x} to {max_x}, midpoint: {mid_x}")
-            else:
-                mid_x = 99999  # If we can't determine, include all
+    def _js_find_day_in_left_panel(self, day):
+        """
+        Find the selectable cell for a day number in the LEFT (start) calendar panel,
+        in a single round-trip.
 
-            for i, cell in enumerate(day_cells):
-                try:
-                    if cell.is_displayed():
-                        cell_text = cell.text.strip()
-                        cell_x = cell.location['x']
+        Args:
+            day: Day of the month (int)
 
-                        # Only consider cells in the LEFT calendar (x < midpoint)
-                        if cell_x >= mid_x:
-                            continue
+        Returns:
+            dict: {'element': WebElement or None, 'texts': [str, ...]}
+        """
+        return self.driver.execute_script(
+            self._JS_FIND_DAY, self.DAY_CELL_SELECTOR, self.LEFT_PANEL_SELECTOR, day
+        ) or {'element': None, 'texts': []}
 
-                        # Check if this cell contains our target day
-                        if cell_text.isdigit() and int(cell_text) == target_day:
-                            # Check it's not disabled or from another month
-                            cell_class = cell.get_attribute('class') or ''
-                            parent_class = ''
-                            try:
-                                parent = cell.find_element(By.XPATH, "./..")
-                                parent_class = parent.get_attribute('class') or ''
-                            except:
-                                pass
-
-                            is_disabled = 'disabled' in cell_class.lower() or 'disabled' in parent_class.lower()
-                            # Check for cells that belong to previous/next month (greyed out)
-                            is_other_month = ('ant-picker-cell-in-view' not in parent_class) if parent_class else False
-
-                            print(f"[CALENDAR]   Cell {i}: text='{cell_text}', x={cell_x}, disabled={is_disabled}, other_month={is_other_month}, in_left={cell_x < mid_x}")
-
-                            # IMPORTANT: Skip cells from other months AND disabled cells
-                            if not is_disabled and not is_other_month:
-                                target_cells.append({
-                                    'element': cell,
-                                    'x': cell_x,
-                                    'y': cell.location['y']
-                                })
-                except Exception as e:
-                    continue
+    def _select_date_in_calendar(self, target):
+        """
+        Select a specific date in the Ant Design calendar popup.
+        Since it's a range picker, click the same date twice in the same month.
 
-            print(f"[CALENDAR] Found {len(target_cells)} matching cells for day {target_day} in left calendar")
+        Args:
+            target: _TargetDate for the date to select
+        """
+        try:
+            print(f"[CALENDAR] Selecting date: {target.iso}")
+            self._wait_until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ".ant-picker-cell-inner")), timeout=5
+            )
 
-            if target_cells:
-                # Use the first matching cell (in the left/start calendar)
-                target_cell = target_cells[0]['element']
+            target_day = target.day
 
-                # Click the date TWICE to select it as both start and end of range
-                print(f"[CALENDAR] Clicking day {target_day} (first click)...")
-                try:
-                    target_cell.click()
-                    print("[CALENDAR] First click successful")
-                except Exception as e:
-                    print(f"[CALENDAR] First click failed: {e}, trying JS click...")
-                    self.driver.execute_script("arguments[0].click();", target_cell)
+            self._dbg(f"[CALENDAR] Target: day={target_day}, month={target.month_abbr} ({target.month}), year={target.year}")
 
-                time.sleep(0.5)
+            # First, navigate to the correct month/year
+            self._navigate_to_month(target.month, target.year)
 
-                # Click the SAME cell again for end date
-                print(f"[CALENDAR] Clicking day {target_day} (second click - same cell)...")
+            # Now find and click the target day TWICE in the LEFT calendar (same month)
+            self._dbg("[CALENDAR] Looking for calendar day cells...")
+
+            # Find the target day among the selectable cells of the LEFT (start) panel
+            # (other-month and disabled cells are already excluded by DAY_CELL_SELECTOR)
+            self._dbg(f"[CALENDAR] Searching for day {target_day} in left calendar...")
+            match = self._js_find_day_in_left_panel(target_day)
+            self._dbg(f"[CALENDAR] Found {len(match['texts'])} selectable day cells in left calendar")
+
+            target_cell = match['element']
+            if target_cell:
+                # Click the date TWICE (start and end of range) in a single round-trip
+                self._dbg(f"[CALENDAR] Clicking day {target_day} twice (start and end of range)...")
                 try:
-                    target_cell.click()
-                    print("[CALENDAR] Second click successful")
+                    self.driver.execute_async_script(self._JS_DOUBLE_CLICK_DAY, target_cell)
                 except Exception as e:
-                    print(f"[CALENDAR] Second click failed: {e}, trying JS click...")
-                    self.driver.execute_script("arguments[0].click();", target_cell)
-
-                time.sleep(1)
+                    print(f"[CALENDAR] Scripted double click failed: {e}, using native clicks...")
+                    # Both clicks go out in one Actions request; the pause gives the
+                    # picker time to mark the range start before the second click
+                    ActionChains(self.driver).click(target_cell).pause(0.3).click(target_cell).perform()
+
+                # The popup closes once the range is complete
+                self._wait_until(EC.invisibility_of_element_located(
+                    (By.CSS_SELECTOR, ".ant-picker-dropdown:not(.ant-picker-dropdown-hidden)")
+                ), timeout=3)
                 print("[CALENDAR] Date selection completed")
 
             else:
                 print(f"[CALENDAR] ERROR: Could not find day {target_day} in left calendar")
-                # Debug: show what cells we can see
-                print("[CALENDAR] Debug - all visible cells in left calendar:")
-                for i, cell in enumerate(day_cells[:42]):  # First 42 = one month
-                    try:
-                        if cell.is_displayed() and cell.location['x'] < mid_x:
-                            print(f"[CALENDAR]   Cell {i}: text='{cell.text}', x={cell.location['x']}")
-                    except:
-                        continue
+                if self.debug:
+                    # Debug: show what cells we can see
+                    print("[CALENDAR] Debug - all visible cells in left calendar:")
+                    print(f"[CALENDAR]   {match['texts']}")
 
         except Exception as e:
             print(f"[CALENDAR] Error selecting date: {e}")
@@ -346,11 +774,10 @@ class AtriaDataExtractor:
             print(f"[CALENDAR-NAV] Navigating to {target_month}/{target_year}...")
 
             max_iterations = 24  # Max 2 years of navigation
-            iteration = 0
-
-            while iteration < max_iterations:
-                iteration += 1
+            max_passes = 3  # Read header, click the computed number of times, re-read to verify
+            clicks = 0
 
+            for _ in range(max_passes):
                 # Get current displayed month/year from the LEFT calendar header
                 current_month, current_year = self._get_current_calendar_month()
 
@@ -358,33 +785,31 @@ class AtriaDataExtractor:
                     print("[CALENDAR-NAV] Could not determine current month/year")
                     break
 
-                print(f"[CALENDAR-NAV] Current: {current_month}/{current_year}, Target: {target_month}/{target_year}")
+                self._dbg(f"[CALENDAR-NAV] Current: {current_month}/{current_year}, Target: {target_month}/{target_year}")
+
+                # Months between the displayed month and the target (positive = forward)
+                delta = (target_year * 12 + target_month) - (current_year * 12 + current_month)
 
                 # Check if we're at the right month
-                if current_month == target_month and current_year == target_year:
+                if delta == 0:
                     print("[CALENDAR-NAV] Reached target month!")
                     return True
 
-                # Calculate direction: need to go forward or backward?
-                current_total = current_year * 12 + current_month
-                target_total = target_year * 12 + target_month
+                direction = "next" if delta > 0 else "prev"
 
-                if target_total > current_total:
-                    # Need to go forward
-                    print("[CALENDAR-NAV] Clicking next month...")
-                    if not self._click_next_month():
-                        print("[CALENDAR-NAV] Failed to click next")
-                        break
-                else:
-                    # Need to go backward
-                    print("[CALENDAR-NAV] Clicking previous month...")
-                    if not self._click_prev_month():
-                        print("[CALENDAR-NAV] Failed to click prev")
-                        break
+                steps = min(abs(delta), max_iterations - clicks)
+                if steps <= 0:
+                    break
 
-                time.sleep(0.5)
+                # All clicks in one round-trip; the header is re-read on the next pass to verify
+                self._dbg(f"[CALENDAR-NAV] Clicking {direction} month {steps} time(s)...")
+                clicked = self._click_month_button(direction, steps)
+                clicks += clicked
+                if clicked < steps:
+                    print(f"[CALENDAR-NAV] Failed to click {direction}")
+                    break
 
-            print(f"[CALENDAR-NAV] Navigation completed after {iteration} iterations")
+            print(f"[CALENDAR-NAV] Navigation completed after {clicks} clicks")
             return True
 
         except Exception as e:
@@ -393,6 +818,22 @@ class AtriaDataExtractor:
             traceback.print_exc()
             return False
 
+    # JavaScript returning the texts of the visible calendar headers (left panel first)
+    # plus the first month/year button texts, in a single round-trip
+    _JS_CALENDAR_HEADER = """
+    var visibleText = function(el) { return el && el.offsetParent !== null ? el.textContent.trim() : ''; };
+    var headers = [];
+    document.querySelectorAll(arguments[0]).forEach(function(h) {
+        var t = visibleText(h);
+        if (t) headers.push(t);
+    });
+    return {
+        headers: headers,
+        month: visibleText(document.querySelector('.ant-picker-month-btn')),
+        year: visibleText(document.querySelector('.ant-picker-year-btn'))
+    };
+    """
+
     def _get_current_calendar_month(self):
         """
         Get the currently displayed month and year from the LEFT calendar.
@@ -401,84 +842,29 @@ class AtriaDataExtractor:
             tuple: (month_number, year) or (None, None) if not found
         """
         try:
-            # Look for month/year buttons in the header
             # The left calendar header typically shows "Dec 2025" or has separate month/year buttons
-
-            # Try finding the header text that contains month and year
-            header_selectors = [
-                ".ant-picker-header-view",
-                ".ant-picker-header button",
-                ".ant-picker-month-btn",
-                ".ant-picker-year-btn",
-            ]
-
-            month_map = {
-                'jan': 1, 'january': 1,
-                'feb': 2, 'february': 2,
-                'mar': 3, 'march': 3,
-                'apr': 4, 'april': 4,
-                'may': 5,
-                'jun': 6, 'june': 6,
-                'jul': 7, 'july': 7,
-                'aug': 8, 'august': 8,
-                'sep': 9, 'september': 9,
-                'oct': 10, 'october': 10,
-                'nov': 11, 'november': 11,
-                'dec': 12, 'december': 12,
-            }
-
-            # Get all header elements
-            headers = self.driver.find_elements(By.CSS_SELECTOR,
-                ".ant-picker-header-view, .ant-picker-panel-header")
+            snapshot = self.driver.execute_script(self._JS_CALENDAR_HEADER, self.HEADER_SELECTOR) or {}
 
             found_month = None
             found_year = None
 
-            for header in headers:
-                try:
-                    if header.is_displayed():
-                        header_text = header.text.lower()
-                        header_x = header.location['x']
-
-                        # Only consider LEFT calendar header (lower x position)
-                        # Usually there are two panels, we want the first one
-                        print(f"[CALENDAR-NAV]   Header: '{header.text}', x={header_x}")
-
-                        # Extract month
-                        for month_name, month_num in month_map.items():
-                            if month_name in header_text:
-                                found_month = month_num
-                                break
-
-                        # Extract year (4 digit number)
-                        import re
-                        year_match = re.search(r'20\d{2}', header_text)
-                        if year_match:
-                            found_year = int(year_match.group())
-
-                        if found_month and found_year:
-                            return (found_month, found_year)
-                except:
-                    continue
+            # Headers come in document order, so the LEFT calendar is checked first
+            for header_text in snapshot.get('headers', []):
+                if self.debug:
+                    print(f"[CALENDAR-NAV]   Header: '{header_text}'")
 
-            # Try individual month and year buttons
-            try:
-                month_btns = self.driver.find_elements(By.CSS_SELECTOR, ".ant-picker-month-btn")
-                year_btns = self.driver.find_elements(By.CSS_SELECTOR, ".ant-picker-year-btn")
+                month, year = _parse_month_year(header_text)
+                found_month = month or found_month
+                found_year = year or found_year
 
-                if month_btns:
-                    for month_name, month_num in month_map.items():
-                        if month_name in month_btns[0].text.lower():
-                            found_month = month_num
-                            break
+                if found_month and found_year:
+                    return (found_month, found_year)
 
-                if year_btns:
-                    import re
-                    year_match = re.search(r'20\d{2}', year_btns[0].text)
-                    if year_match:
-                        found_year = int(year_match.group())
-            except:
-                pass
+            # Try individual month and year buttons
+            if snapshot.get('month'):
+                found_month = _parse_month_year(snapshot['month'])[0] or found_month
+            if snapshot.get('year'):
+                found_year = _parse_month_year(snapshot['year'])[1] or found_year
 
             return (found_month, found_year)
 
@@ -486,84 +872,147 @@ class AtriaDataExtractor:
             print(f"[CALENDAR-NAV] Error getting current month: {e}")
             return (None, None)
 
-    def _click_next_month(self):
-        """Click the next month button (>)."""
-        try:
-            # Ant Design uses specific classes for navigation buttons
-            next_selectors = [
-                ".ant-picker-header-next-btn",
-                "button.ant-picker-header-next-btn",
-                ".ant-picker-header button[class*='next']",
-                "button[aria-label*='next']",
-                "button[aria-label*='Next']",
-            ]
+    # JavaScript returning the first shown month navigation button: tries each selector in
+    # order, then any header button whose text is the given symbol ('>' or '<'). Range
+    # pickers hide the inner arrows with visibility:hidden, which offsetParent misses.
+    _JS_FIND_NAV_BUTTON = """
+    var shown = function(e) {
+        return e.offsetParent !== null && getComputedStyle(e).visibility !== 'hidden';
+    };
+    var selectors = arguments[0];
+    for (var s = 0; s < selectors.length; s++) {
+        var nodes = document.querySelectorAll(selectors[s]);
+        for (var i = 0; i < nodes.length; i++) {
+            if (shown(nodes[i])) return nodes[i];
+        }
+    }
+    var buttons = document.querySelectorAll('.ant-picker-header button');
+    for (var j = 0; j < buttons.length; j++) {
+        if (shown(buttons[j]) && buttons[j].innerText.trim() === arguments[1]) return buttons[j];
+    }
+    return null;
+    """
 
-            for selector in next_selectors:
-                try:
-                    btns = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for btn in btns:
-                        if btn.is_displayed():
-                            # Get the first (leftmost) next button for the left calendar
-                            btn.click()
-                            print(f"[CALENDAR-NAV] Clicked next button")
-                            return True
-                except:
-                    continue
+    # Async JavaScript clicking a month navigation button N times. After each click it
+    # waits (up to ~0.5s) for the first calendar header to change, so every click sees the
+    # re-rendered month. Returns the number of clicks made (fewer if the button detached).
+    _JS_CLICK_NAV_BUTTON = """
+    var btn = arguments[0], times = arguments[1], headerSelector = arguments[2];
+    var done = arguments[arguments.length - 1];
+    var headerText = function() {
+        var h = document.querySelector(headerSelector);
+        return h ? h.textContent : '';
+    };
+    var clicked = 0;
+    var step = function() {
+        if (clicked >= times || !btn.isConnected) { done(clicked); return; }
+        var before = headerText();
+        btn.click();
+        clicked++;
+        var tries = 0;
+        var settle = function() {
+            if (headerText() !== before || ++tries > 20) { step(); return; }
+            setTimeout(settle, 25);
+        };
+        settle();
+    };
+    step();
+    """
 
-            # Fallback: find by > character
-            try:
-                buttons = self.driver.find_elements(By.CSS_SELECTOR, ".ant-picker-header button")
-                for btn in buttons:
-                    if btn.is_displayed() and btn.text.strip() == '>':
-                        btn.click()
-                        return True
-            except:
-                pass
+    def _click_month_button(self, direction, times=1):
+        """
+        Click the next/previous month button one or more times in a single round-trip.
+        The button is located once and reused for every following call; it is re-located
+        only if it has gone stale.
 
-            return False
+        Args:
+            direction: 'next' or 'prev'
+            times: Number of months to move
 
-        except Exception as e:
-            print(f"[CALENDAR-NAV] Error clicking next: {e}")
-            return False
+        Returns:
+            int: Number of clicks made
+        """
+        if direction == 'next':
+            selectors, symbol = self.NEXT_SELECTORS, '>'
+        else:
+            selectors, symbol = self.PREV_SELECTORS, '<'
+        key = f'{direction}_month_btn'
 
-    def _click_prev_month(self):
-        """Click the previous month button (<)."""
         try:
-            # Ant Design uses specific classes for navigation buttons
-            prev_selectors = [
-                ".ant-picker-header-prev-btn",
-                "button.ant-picker-header-prev-btn",
-                ".ant-picker-header button[class*='prev']",
-                "button[aria-label*='prev']",
-                "button[aria-label*='Prev']",
-            ]
-
-            for selector in prev_selectors:
+            for _ in range(2):
+                btn = self._element_cache.get(key)
+                if btn is None:
+                    btn = self.driver.execute_script(self._JS_FIND_NAV_BUTTON, list(selectors), symbol)
+                    if btn is None:
+                        return 0
                 try:
-                    btns = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for btn in btns:
-                        if btn.is_displayed():
-                            btn.click()
-                            print(f"[CALENDAR-NAV] Clicked prev button")
-                            return True
-                except:
+                    clicked = self.driver.execute_async_script(
+                        self._JS_CLICK_NAV_BUTTON, btn, times, self.HEADER_SELECTOR
+                    ) or 0
+                except StaleElementReferenceException:
+                    self._element_cache.pop(key, None)
                     continue
+                self._element_cache[key] = btn
+                self._dbg(f"[CALENDAR-NAV] Clicked {direction} button {clicked} time(s)")
+                return clicked
+            return 0
 
-            # Fallback: find by < character
-            try:
-                buttons = self.driver.find_elements(By.CSS_SELECTOR, ".ant-picker-header button")
-                for btn in buttons:
-                    if btn.is_displayed() and btn.text.strip() == '<':
-                        btn.click()
-                        return True
-            except:
-                pass
+        except Exception as e:
+            print(f"[CALENDAR-NAV] Error clicking {direction}: {e}")
+            return 0
+
+    # JavaScript returning the first visible button around a visible filter icon (class or
+    # aria-label containing 'filter'), or null
+    _JS_FILTER_ICON_BUTTON = """
+    var icons = document.querySelectorAll("[class*='filter'], [aria-label*='filter']");
+    for (var i = 0; i < icons.length; i++) {
+        if (icons[i].offsetParent === null) continue;
+        var btn = icons[i].closest('button');
+        if (btn && btn.offsetParent !== null) return btn;
+    }
+    return null;
+    """
 
-            return False
+    def _locate_dimension_filter_btn(self):
+        """
+        Locate the visible "Dimension filter" button using several fallback strategies.
+        Every strategy checks visibility in the browser, so callers can click the result directly.
 
+        Returns:
+            WebElement or None
+        """
+        dimension_filter_btn = None
+
+        # Strategy 1: Find the visible element with the exact text content
+        self._dbg("[FILTER] Looking for 'Dimension filter' button...")
+        try:
+            dimension_filter_btn = self._find_visible_text('Dimension filter')
+            if dimension_filter_btn and self.debug:
+                print(f"[FILTER] Found by text: {dimension_filter_btn.tag_name}")
         except Exception as e:
-            print(f"[CALENDAR-NAV] Error clicking prev: {e}")
-            return False
+            print(f"[FILTER] Text search failed: {e}")
+
+        # Strategy 2: Find button with filter-related text
+        if not dimension_filter_btn:
+            self._dbg("[FILTER] Looking for button with filter text...")
+            try:
+                dimension_filter_btn = self._find_visible("button", "dimension|filter")
+                if dimension_filter_btn and self.debug:
+                    print(f"[FILTER]   Button: text='{dimension_filter_btn.text}'")
+            except Exception as e:
+                print(f"[FILTER] Button search failed: {e}")
+
+        # Strategy 3: Find by icon class (filter funnel icon) and take its button
+        if not dimension_filter_btn:
+            self._dbg("[FILTER] Looking for filter icon...")
+            try:
+                dimension_filter_btn = self.driver.execute_script(self._JS_FILTER_ICON_BUTTON)
+                if dimension_filter_btn:
+                    self._dbg("[FILTER]   Found filter button via icon")
+            except Exception as e:
+                print(f"[FILTER] Icon search failed: {e}")
+
+        return dimension_filter_btn
 
     def apply_dimension_filter(self, campaign_filter_text="aware"):
         """
@@ -575,92 +1024,102 @@ class AtriaDataExtractor:
         print(f"[FILTER] Applying dimension filter (Campaign name does not contain '{campaign_filter_text}')...")
 
         try:
-            time.sleep(2)
+            self._wait_until(lambda d: self._find_visible_text('Dimension filter'))
 
             # Find and click the "Dimension filter" button
-            dimension_filter_btn = None
-
-            # Strategy 1: Find by exact text content
-            print("[FILTER] Looking for 'Dimension filter' button...")
-            try:
-                dimension_filter_btn = self.driver.find_element(
-                    By.XPATH, "//*[contains(text(), 'Dimension filter')]"
-                )
-                print(f"[FILTER] Found by text: {dimension_filter_btn.tag_name}")
-            except Exception as e:
-                print(f"[FILTER] Text search failed: {e}")
-
-            # Strategy 2: Find button with filter-related text
-            if not dimension_filter_btn:
-                print("[FILTER] Looking for button with filter text...")
-                try:
-                    buttons = self.driver.find_elements(By.XPATH, "//button")
-                    print(f"[FILTER] Found {len(buttons)} buttons")
-                    for i, btn in enumerate(buttons):
-                        try:
-                            btn_text = btn.text.lower()
-                            if btn.is_displayed() and ('dimension' in btn_text or 'filter' in btn_text):
-                                print(f"[FILTER]   Button {i}: text='{btn.text}'")
-                                dimension_filter_btn = btn
-                                break
-                        except:
-                            continue
-                except Exception as e:
-                    print(f"[FILTER] Button search failed: {e}")
+            with self._no_implicit_wait():
+                dimension_filter_btn = self._cached('dim_filter_btn', self._locate_dimension_filter_btn)
 
-            # Strategy 3: Find by icon class (filter funnel icon)
-            if not dimension_filter_btn:
-                print("[FILTER] Looking for filter icon...")
-                try:
-                    filter_icons = self.driver.find_elements(By.XPATH,
-                        "//*[contains(@class, 'filter') or contains(@aria-label, 'filter')]")
-                    print(f"[FILTER] Found {len(filter_icons)} filter elements")
-                    for elem in filter_icons:
-                        try:
-                            if elem.is_displayed():
-                                parent = elem.find_element(By.XPATH, "./ancestor::button[1]")
-                                if parent.is_displayed():
-                                    print(f"[FILTER]   Found filter button via icon")
-                                    dimension_filter_btn = parent
-                                    break
-                        except:
-                            continue
-                except Exception as e:
-                    print(f"[FILTER] Icon search failed: {e}")
+            if dimension_filter_btn:
+                self._dbg("[FILTER] Clicking Dimension filter button...")
+                self._fast_click(dimension_filter_btn)
 
-            if dimension_filter_btn and dimension_filter_btn.is_displayed():
-                print("[FILTER] Clicking Dimension filter button...")
-                try:
-                    dimension_filter_btn.click()
-                    print("[FILTER] Click successful")
-                except Exception as e:
-                    print(f"[FILTER] Direct click failed: {e}, trying JS click...")
-                    self.driver.execute_script("arguments[0].click();", dimension_filter_btn)
-
-                time.sleep(2)
+                # Wait for the filter popup to open
+                self._wait_visible(
+                    self.FILTER_POPUP_SELECTOR,
+                    timeout=5,
+                )
 
                 # Now configure the filter
                 self._configure_filter(campaign_filter_text)
             else:
                 print("[FILTER] ERROR: Could not find Dimension filter button")
-                # Debug: show clickable elements
-                print("[FILTER] Debug - showing potential filter buttons:")
-                try:
-                    all_buttons = self.driver.find_elements(By.XPATH, "//button")
-                    for i, btn in enumerate(all_buttons[:20]):
-                        try:
-                            if btn.is_displayed():
-                                print(f"[FILTER]   Button {i}: text='{btn.text[:30]}', y={btn.location['y']}")
-                        except:
-                            continue
-                except:
-                    pass
+                if self.debug:
+                    # Debug: show clickable elements
+                    print("[FILTER] Debug - showing potential filter buttons:")
+                    try:
+                        buttons = self.driver.execute_script("""
+                            return Array.from(document.querySelectorAll('button')).slice(0, 20).map(function(btn, i) {
+                                if (btn.offsetParent === null) return null;
+                                return {i: i, text: (btn.innerText || '').slice(0, 30),
+                                        y: Math.round(btn.getBoundingClientRect().top + window.scrollY)};
+                            }).filter(Boolean);
+                        """) or []
+                        for btn in buttons:
+                            print(f"[FILTER]   Button {btn['i']}: text='{btn['text']}', y={btn['y']}")
+                    except:
+                        pass
 
         except Exception as e:
             print(f"[FILTER] Error applying dimension filter: {e}")
             import traceback
             traceback.print_exc()
 
+    # Open filter popup (popover, modal or drawer)
+    FILTER_POPUP_SELECTORS = (
+        ".ant-popover:not(.ant-popover-hidden)",
+        ".ant-modal-content",
+        ".ant-drawer-content",
+    )
+    FILTER_POPUP_SELECTOR = ", ".join(FILTER_POPUP_SELECTORS)
+
+    # Ant Design select components (plus generic select/dropdown fallbacks) and value
+    # inputs (everything except the date picker's), page-wide and scoped to the popup
+    PAGE_DROPDOWN_SELECTOR = ".ant-select, select, [class*='select'], [class*='dropdown']"
+    PAGE_INPUT_SELECTOR = "input[type='text'], input:not([type]), input[placeholder]"
+    FILTER_DROPDOWN_SELECTOR = f":is({FILTER_POPUP_SELECTOR}) :is(.ant-select, select)"
+    FILTER_INPUT_SELECTOR = f":is({FILTER_POPUP_SELECTOR}) :is({PAGE_INPUT_SELECTOR})"
+
+    def _locate_apply_btn(self):
+        """
+        Locate the filter popup's Apply button.
+
+        Returns:
+            WebElement or None
+        """
+        # Find the first visible button labelled Apply
+        apply_btn = self._find_visible("button, span[class*='btn']", "apply")
+        if apply_btn and self.debug:
+            print(f"[FILTER-CONFIG] Found Apply button: {apply_btn.text}")
+
+        if not apply_btn:
+            # Try by Ant Design button class
+            try:
+                apply_btn = self.driver.find_element(By.CSS_SELECTOR,
+                    "button.ant-btn-primary, button[type='submit']")
+                self._dbg("[FILTER-CONFIG] Found primary button")
+            except NoSuchElementException:
+                pass
+
+        return apply_btn
+
+    # JavaScript returning the filter value input: the first visible match of the selector
+    # whose placeholder does not mention a date, as {element, index, inputs}; inputs holds
+    # {type, placeholder, visible} for every match (for debug output)
+    _JS_FILTER_VALUE_INPUT = """
+    var result = {element: null, index: -1, inputs: []};
+    document.querySelectorAll(arguments[0]).forEach(function(e, i) {
+        var visible = e.offsetParent !== null;
+        var placeholder = e.getAttribute('placeholder') || '';
+        result.inputs.push({type: e.getAttribute('type'), placeholder: placeholder, visible: visible});
+        if (!result.element && visible && !/date/i.test(placeholder)) {
+            result.element = e;
+            result.index = i;
+        }
+    });
+    return result;
+    """
+
     def _configure_filter(self, filter_text):
         """
         Configure the dimension filter popup.
@@ -671,171 +1130,119 @@ class AtriaDataExtractor:
         """
         try:
             print("[FILTER-CONFIG] Configuring filter popup...")
-            time.sleep(2)
 
             # Find dropdowns and input in the filter popup
             # Ant Design uses ant-select for dropdowns
-            print("[FILTER-CONFIG] Looking for dropdowns...")
-
-            # Strategy 1: Find Ant Design select components
-            dropdowns = self.driver.find_elements(By.CSS_SELECTOR,
-                ".ant-select, select, [class*='select'], [class*='dropdown']")
-            print(f"[FILTER-CONFIG] Found {len(dropdowns)} dropdown elements")
+            self._dbg("[FILTER-CONFIG] Looking for dropdowns...")
+
+            # Wait for the popup's dropdowns to render; the first visible one doubles as the
+            # fallback first dropdown, so it is not looked up again below
+            dropdown_selector = self.FILTER_DROPDOWN_SELECTOR
+            input_selector = self.FILTER_INPUT_SELECTOR
+            first_visible_dropdown = self._wait_until(lambda d: self._find_visible(dropdown_selector), timeout=5)
+            if not first_visible_dropdown:
+                # Unknown popup container: fall back to page-wide selectors
+                self._dbg("[FILTER-CONFIG] No dropdowns inside the popup, searching the whole page...")
+                dropdown_selector = self.PAGE_DROPDOWN_SELECTOR
+                input_selector = self.PAGE_INPUT_SELECTOR
+                first_visible_dropdown = self._find_visible(dropdown_selector)
 
             # Try to find and click first dropdown (Campaign name)
-            print("[FILTER-CONFIG] Setting first dropdown (Campaign name)...")
+            self._dbg("[FILTER-CONFIG] Setting first dropdown (Campaign name)...")
             try:
-                first_dropdown = None
-                for i, dd in enumerate(dropdowns):
-                    try:
-                        if dd.is_displayed():
-                            dd_text = dd.text.lower()
-                            print(f"[FILTER-CONFIG]   Dropdown {i}: text='{dd.text[:30]}', class='{dd.get_attribute('class')[:30] if dd.get_attribute('class') else ''}'")
-                            if 'campaign' in dd_text:
-                                first_dropdown = dd
-                                print(f"[FILTER-CONFIG]   -> Selected (contains 'campaign')")
-                                break
-                    except:
-                        continue
-
-                if not first_dropdown and dropdowns:
+                first_dropdown = self._find_visible(dropdown_selector, "campaign")
+                if first_dropdown:
+                    self._dbg(f"[FILTER-CONFIG]   -> Selected (contains 'campaign')")
+                else:
                     # Click the first visible dropdown
-                    for dd in dropdowns:
-                        if dd.is_displayed():
-                            first_dropdown = dd
-                            print(f"[FILTER-CONFIG] Using first visible dropdown")
-                            break
+                    first_dropdown = first_visible_dropdown
+                    if first_dropdown:
+                        self._dbg(f"[FILTER-CONFIG] Using first visible dropdown")
 
                 if first_dropdown:
-                    print("[FILTER-CONFIG] Clicking first dropdown...")
+                    self._dbg("[FILTER-CONFIG] Clicking first dropdown...")
                     first_dropdown.click()
-                    time.sleep(1)
 
-                    # Select "Campaign name" option
-                    print("[FILTER-CONFIG] Looking for 'Campaign name' option...")
+                    # Select "Campaign name" option (waits for the option list to open)
+                    self._dbg("[FILTER-CONFIG] Looking for 'Campaign name' option...")
                     try:
-                        campaign_options = self.driver.find_elements(
-                            By.XPATH, "//*[contains(text(), 'Campaign name') or contains(text(), 'campaign name') or contains(text(), 'Campaign Name')]"
-                        )
-                        print(f"[FILTER-CONFIG] Found {len(campaign_options)} campaign name options")
-                        for opt in campaign_options:
-                            if opt.is_displayed():
+                        opt = self._wait_until(lambda d: self._find_visible_text('campaign name'), timeout=5)
+                        if opt:
+                            if self.debug:
                                 print(f"[FILTER-CONFIG] Clicking: {opt.text}")
-                                opt.click()
-                                time.sleep(1)
-                                break
+                            opt.click()
+                        else:
+                            print("[FILTER-CONFIG] No visible 'Campaign name' option")
                     except Exception as e:
                         print(f"[FILTER-CONFIG] Campaign name selection: {e} (may already be selected)")
             except Exception as e:
                 print(f"[FILTER-CONFIG] Error with first dropdown: {e}")
 
             # Second dropdown: does not contain
-            print("[FILTER-CONFIG] Setting second dropdown (does not contain)...")
+            self._dbg("[FILTER-CONFIG] Setting second dropdown (does not contain)...")
             try:
-                operator_options = [
-                    "does not contain",
-                    "does not",
-                    "not contain",
-                    "doesn't contain"
-                ]
-
-                # Re-find dropdowns after first selection
-                dropdowns = self.driver.find_elements(By.CSS_SELECTOR,
-                    ".ant-select, select, [class*='select'], [class*='dropdown']")
-
-                for dd in dropdowns:
-                    try:
-                        if dd.is_displayed():
-                            text = dd.text.lower()
-                            if any(op in text for op in ['contain', 'equal', 'match', 'does', 'is']):
-                                print(f"[FILTER-CONFIG] Found operator dropdown: {dd.text}")
-                                dd.click()
-                                time.sleep(1)
-                                break
-                    except:
-                        continue
+                # Re-find dropdowns after first selection, waiting for the operator
+                # dropdown to render once the campaign option list has closed
+                dd = self._wait_until(
+                    lambda d: self._find_visible(dropdown_selector, _OPERATOR_RE.pattern),
+                    timeout=5,
+                )
+                if dd:
+                    if self.debug:
+                        print(f"[FILTER-CONFIG] Found operator dropdown: {dd.text}")
+                    dd.click()
 
                 # Select "does not contain" option
-                print("[FILTER-CONFIG] Looking for 'does not contain' option...")
-                for op in operator_options:
-                    try:
-                        option_elems = self.driver.find_elements(
-                            By.XPATH, f"//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{op}')]"
-                        )
-                        for opt in option_elems:
-                            if opt.is_displayed():
-                                print(f"[FILTER-CONFIG] Clicking operator: {opt.text}")
-                                opt.click()
-                                time.sleep(1)
-                                break
-                    except:
-                        continue
+                self._dbg("[FILTER-CONFIG] Looking for 'does not contain' option...")
+                # Wait for the operator list to open; the wait returns the matching option
+                # (all spellings in one browser-side regex), with a looser fallback
+                opt = self._wait_until(lambda d: self._find_visible_text(_NOT_CONTAIN_RE.pattern), timeout=5)
+                if not opt:
+                    opt = self._find_visible_text("does not")
+                if opt:
+                    if self.debug:
+                        print(f"[FILTER-CONFIG] Clicking operator: {opt.text}")
+                    opt.click()
+                else:
+                    print("[FILTER-CONFIG] No visible 'does not contain' option")
             except Exception as e:
                 print(f"[FILTER-CONFIG] Error with operator dropdown: {e}")
 
             # Third field: text input for filter value
             print(f"[FILTER-CONFIG] Entering filter text: '{filter_text}'...")
             try:
-                text_inputs = self.driver.find_elements(By.CSS_SELECTOR,
-                    "input[type='text'], input:not([type]), input[placeholder]")
-                print(f"[FILTER-CONFIG] Found {len(text_inputs)} text inputs")
-
-                for i, inp in enumerate(text_inputs):
-                    try:
-                        if inp.is_displayed():
-                            inp_type = inp.get_attribute('type')
-                            inp_placeholder = inp.get_attribute('placeholder') or ''
-                            print(f"[FILTER-CONFIG]   Input {i}: type='{inp_type}', placeholder='{inp_placeholder}'")
-
-                            # Skip date inputs
-                            if 'date' not in inp_placeholder.lower():
-                                inp.clear()
-                                inp.send_keys(filter_text)
-                                print(f"[FILTER-CONFIG] Entered filter text in input {i}")
-                                time.sleep(1)
-                                break
-                    except Exception as e:
-                        print(f"[FILTER-CONFIG]   Input {i} error: {e}")
-                        continue
+                # Pick the value input in the browser (one round-trip for all inputs)
+                match = self.driver.execute_script(self._JS_FILTER_VALUE_INPUT, input_selector) or {}
+                inputs = match.get('inputs', [])
+                self._dbg(f"[FILTER-CONFIG] Found {len(inputs)} text inputs")
+                if self.debug:
+                    for i, inp in enumerate(inputs):
+                        if inp['visible']:
+                            print(f"[FILTER-CONFIG]   Input {i}: type='{inp['type']}', placeholder='{inp['placeholder']}'")
+
+                inp = match.get('element')
+                if inp:
+                    inp.clear()
+                    inp.send_keys(filter_text)
+                    self._dbg(f"[FILTER-CONFIG] Entered filter text in input {match['index']}")
+                else:
+                    print("[FILTER-CONFIG] No visible filter value input")
             except Exception as e:
                 print(f"[FILTER-CONFIG] Error entering filter text: {e}")
 
             # Click Apply button
-            print("[FILTER-CONFIG] Looking for Apply button...")
+            self._dbg("[FILTER-CONFIG] Looking for Apply button...")
             try:
-                apply_btn = None
-
-                # Find Apply button
-                buttons = self.driver.find_elements(By.XPATH, "//button | //span[contains(@class, 'btn')]")
-                print(f"[FILTER-CONFIG] Found {len(buttons)} buttons")
-
-                for btn in buttons:
-                    try:
-                        if btn.is_displayed():
-                            btn_text = btn.text.lower()
-                            if 'apply' in btn_text:
-                                print(f"[FILTER-CONFIG] Found Apply button: {btn.text}")
-                                apply_btn = btn
-                                break
-                    except:
-                        continue
-
-                if not apply_btn:
-                    # Try by Ant Design button class
-                    try:
-                        apply_btn = self.driver.find_element(By.CSS_SELECTOR,
-                            "button.ant-btn-primary, button[type='submit']")
-                        print(f"[FILTER-CONFIG] Found primary button")
-                    except:
-                        pass
-
-                if apply_btn and apply_btn.is_displayed():
-                    print("[FILTER-CONFIG] Clicking Apply button...")
-                    try:
-                        apply_btn.click()
-                    except:
-                        self.driver.execute_script("arguments[0].click();", apply_btn)
-                    time.sleep(3)
+                with self._no_implicit_wait():
+                    apply_btn = self._cached('apply_btn', self._locate_apply_btn)
+
+                if apply_btn and self._wait_until(EC.element_to_be_clickable(apply_btn), timeout=5):
+                    self._dbg("[FILTER-CONFIG] Clicking Apply button...")
+                    self._fast_click(apply_btn)
+                    # The popup closes once the filter is applied
+                    self._wait_until(EC.invisibility_of_element_located(
+                        (By.CSS_SELECTOR, self.FILTER_POPUP_SELECTOR)
+                    ), timeout=5)
                     print("[FILTER-CONFIG] Filter applied successfully")
                 else:
                     print("[FILTER-CONFIG] ERROR: Could not find Apply button")
@@ -848,62 +1255,180 @@ class AtriaDataExtractor:
             import traceback
             traceback.print_exc()
 
-    def wait_for_data_load(self, timeout=15):
-        """Wait for data to finish loading."""
-        print("[LOAD] Waiting for data to load...")
+    # JavaScript returning the first visible loading indicator, or null: an element whose
+    # own text contains "Loading"/"loading", else an Ant Design spin / AG Grid overlay /
+    # spinner. ag-aria-description-container is a permanent AG Grid accessibility element.
+    _JS_VISIBLE_LOADER = """
+    var permanent = function(e) {
+        return (e.getAttribute('class') || '').indexOf('ag-aria-description-container') !== -1;
+    };
+    var walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    for (var node = walker.nextNode(); node; node = walker.nextNode()) {
+        var e = node.parentElement;
+        if (e && /Loading|loading/.test(node.nodeValue) && e.offsetParent !== null && !permanent(e)) return e;
+    }
+    var spinners = document.querySelectorAll(
+        ".ant-spin, .ag-overlay-loading-center, .loading, [class*='spinner']"
+    );
+    for (var i = 0; i < spinners.length; i++) {
+        if (spinners[i].offsetParent !== null && !permanent(spinners[i])) return spinners[i];
+    }
+    return null;
+    """
+
+    def _visible_loader(self, driver=None):
+        """
+        Return the first visible loading indicator (text or spinner), or None, in a
+        single round-trip.
 
+        IMPORTANT: Excludes permanent AG Grid elements that are not loaders
+        (ag-aria-description-container is a permanent accessibility element).
+        """
+        driver = driver or self.driver
         try:
-            # Wait for loading indicator to disappear or data to appear
-            time.sleep(3)  # Initial wait (reduced from 5 to 3)
+            return driver.execute_script(self._JS_VISIBLE_LOADER)
+        except Exception:
+            return None
 
-            # Check for loading indicators
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                try:
-                    # Look for loading text or spinner
-                    loading_elements = self.driver.find_elements(
-                        By.XPATH, "//*[contains(text(), 'Loading') or contains(text(), 'loading')]"
-                    )
+    def wait_for_data_load(self, timeout=15, expect_loader=True):
+        """
+        Wait for data to finish loading.
 
-                    # Also check for Ant Design spin (but exclude permanent elements)
-                    spin_elements = self.driver.find_elements(By.CSS_SELECTOR, ".ant-spin, .loading, [class*='spinner']")
-
-                    loading_visible = False
-                    for elem in loading_elements + spin_elements:
-                        try:
-                            if elem.is_displayed():
-                                # Get the class name
-                                elem_class = elem.get_attribute('class') or ''
-                                elem_text = elem.text[:30] if elem.text else ''
-
-                                # IMPORTANT: Exclude permanent AG Grid elements that are not loaders
-                                # ag-aria-description-container is a permanent accessibility element
-                                if 'ag-aria-description-container' in elem_class:
-                                    continue  # Skip this, it's not a loading indicator
-
-                                # If we get here, it's a real loading indicator
-                                print(f"[LOAD]   Still loading: {elem_class[:40] if elem_class else elem_text}")
-                                loading_visible = True
-                                break
-                        except:
-                            continue
+        Args:
+            timeout: Maximum seconds to wait for the loading indicators to disappear
+            expect_loader: Give a just-started load up to 2s to show its loader first.
+                Pass False when the date was set a while ago (e.g. in another tab),
+                so the load is already running or done.
+        """
+        print("[LOAD] Waiting for data to load...")
 
-                    if not loading_visible:
-                        print("[LOAD] Data loaded successfully")
-                        time.sleep(1)  # Extra wait for rendering (reduced from 2 to 1)
-                        return True
+        try:
+            # Give the report a moment to start loading (returns as soon as a loader shows)
+            loader = self._wait_until(self._visible_loader, timeout=2) if expect_loader else self._visible_loader()
+            if loader is not None:
+                try:
+                    # Text (or tag name for spinners) read in one round-trip
+                    label = self.driver.execute_script(
+                        "return arguments[0].innerText.trim().slice(0, 30) || arguments[0].tagName.toLowerCase();",
+                        loader,
+                    )
+                    print(f"[LOAD]   Still loading: {label}")
+                except StaleElementReferenceException:
+                    pass
 
-                    time.sleep(1)
-                except:
-                    time.sleep(1)
+            # Wait for every loading indicator to disappear
+            if self._wait_until(lambda d: self._visible_loader(d) is None, timeout) is None:
+                print("[LOAD] Loading wait timeout, proceeding anyway...")
+                return True
 
-            print("[LOAD] Loading wait timeout, proceeding anyway...")
+            # Wait for rendered rows (grid, table or cards) instead of a fixed render delay
+            self._wait_until(EC.presence_of_element_located(
+                (By.CSS_SELECTOR, ".ag-row, table tbody tr, [class*='card']")
+            ), timeout=2)
+            print("[LOAD] Data loaded successfully")
             return True
 
         except Exception as e:
             print(f"[LOAD] Error waiting for load: {e}")
             return True
 
+    # Rendered data rows: AG Grid body rows or HTML table body rows
+    DATA_ROW_SELECTOR = ".ag-center-cols-container .ag-row, table tbody tr"
+
+    # JavaScript returning the first rendered data row and a signature of the rendered
+    # rows (count + first row text), or null when no rows are rendered
+    _JS_ROWS_SNAPSHOT = """
+    var rows = document.querySelectorAll(arguments[0]);
+    if (!rows.length) return null;
+    return {row: rows[0], sig: rows.length + '|' + rows[0].innerText};
+    """
+
+    # JavaScript returning true once the snapshot's first row is detached, no rows are
+    # rendered, or the rows' signature differs from the snapshot's
+    _JS_ROWS_CHANGED = """
+    if (!arguments[1].isConnected) return true;
+    var rows = document.querySelectorAll(arguments[0]);
+    return !rows.length || (rows.length + '|' + rows[0].innerText) !== arguments[2];
+    """
+
+    def change_date(self, target_date, timeout=10):
+        """
+        Set a new date on a report that already shows another date's rows, and wait until
+        those rows have been replaced, so wait_for_data_load cannot be satisfied by them.
+
+        Args:
+            target_date: datetime object for the date to select
+            timeout: Maximum seconds to wait for the old rows to go
+        """
+        snapshot = self.driver.execute_script(self._JS_ROWS_SNAPSHOT, self.DATA_ROW_SELECTOR)
+        self.set_date(target_date)
+        if not snapshot:
+            return
+
+        def rows_changed(driver):
+            try:
+                return driver.execute_script(
+                    self._JS_ROWS_CHANGED, self.DATA_ROW_SELECTOR, snapshot['row'], snapshot['sig']
+                )
+            except StaleElementReferenceException:
+                return True
+
+        if self._wait_until(rows_changed, timeout) is None:
+            print("[LOAD] Rows did not change after the date switch, extracting anyway...")
+
+    # Card container selectors, in order of preference
+    CARD_SELECTORS = (
+        ".card",
+        ".data-card",
+        "[class*='card']",
+        ".ag-center-cols-container > div",  # AG Grid card mode
+        ".ag-row",  # AG Grid rows (might be cards)
+    )
+
+    # JavaScript returning the first card selector that has visible matches, plus the
+    # text/anchor payload of (up to arguments[1]) visible cards. href/anchorText are null
+    # when a card has no a[href].
+    _JS_FIND_CARDS = """
+    var selectors = arguments[0];
+    for (var s = 0; s < selectors.length; s++) {
+        var cards = Array.from(document.querySelectorAll(selectors[s])).filter(function(c) {
+            return c.offsetParent !== null;
+        });
+        if (!cards.length) continue;
+        return {
+            selector: selectors[s],
+            total: cards.length,
+            cards: cards.slice(0, arguments[1]).map(function(c) {
+                var a = c.querySelector('a[href]');
+                return {
+                    text: c.innerText.trim(),
+                    href: a ? a.href : null,
+                    anchorText: a ? a.innerText.trim() : null
+                };
+            })
+        };
+    }
+    return null;
+    """
+
+    def _extract_cards_payload(self, limit=50):
+        """
+        Find the card containers and read their text and anchor in a single round-trip.
+
+        The first selector in CARD_SELECTORS with visible matches wins.
+
+        Args:
+            limit: Maximum number of cards to return
+
+        Returns:
+            list: [{'text', 'href', 'anchorText'}, ...] (href/anchorText are None without an anchor)
+        """
+        match = self.driver.execute_script(self._JS_FIND_CARDS, list(self.CARD_SELECTORS), limit)
+        if not match:
+            return []
+        print(f"[CARD] Using {match['total']} visible cards from '{match['selector']}'")
+        return match['cards']
+
     def _extract_card_data(self):
         """
         Extract data from card-based layout.
@@ -916,32 +1441,9 @@ class AtriaDataExtractor:
         table_data = []
 
         try:
-            time.sleep(2)
-
-            # Look for card containers
-            # Try different card container selectors
-            card_selectors = [
-                ".card",
-                ".data-card",
-                "[class*='card']",
-                ".ag-center-cols-container > div",  # AG Grid card mode
-                ".ag-row",  # AG Grid rows (might be cards)
-            ]
-
-            cards = []
-            for selector in card_selectors:
-                try:
-                    found_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if found_cards:
-                        print(f"[CARD] Found {len(found_cards)} elements with selector '{selector}'")
-                        # Filter for displayed cards
-                        cards = [c for c in found_cards if c.is_displayed()]
-                        if cards:
-                            print(f"[CARD] Using {len(cards)} visible cards from '{selector}'")
-                            break
-                except Exception as e:
-                    print(f"[CARD] Selector '{selector}' failed: {e}")
-                    continue
+            # Plain-data payload of the first 50 cards (no WebElements past this point),
+            # polled until cards render instead of a fixed delay
+            cards = self._wait_until(lambda d: self._extract_cards_payload(), timeout=2) or []
 
             if not cards:
                 print("[CARD] No cards found")
@@ -949,67 +1451,53 @@ class AtriaDataExtractor:
 
             print(f"[CARD] Processing {len(cards)} cards...")
 
-            for card_idx, card in enumerate(cards[:50]):  # Limit to first 50 cards
-                try:
-                    # Extract all text from the card
-                    card_text = card.text.strip()
+            # Find numbers in every card's text (ROAS, Spend, etc.) in one pass
+            card_numbers = [_NUM_RE.findall(card['text']) for card in cards]
 
-                    if not card_text:
-                        continue
+            for card_idx, (card, numbers) in enumerate(zip(cards, card_numbers)):  # Already limited to first 50 cards
+                # All text from the card
+                card_text = card['text']
 
-                    # Try to find URL (anchor tag)
-                    landing_page = ""
-                    try:
-                        anchor = card.find_element(By.CSS_SELECTOR, "a[href]")
-                        href = anchor.get_attribute("href")
-                        landing_page = href if href else anchor.text.strip()
-                    except:
-                        # Try to extract URL from text
-                        lines = card_text.split('\n')
-                        for line in lines:
-                            if 'http' in line.lower() or '.com' in line.lower() or '.de' in line.lower():
-                                landing_page = line.strip()
-                                break
-
-                    # Try to find ROAS value (number, possibly with decimal)
-                    roas = ""
-                    try:
-                        # Look for elements with ROAS-related text
-                        import re
-                        # Find numbers in the card text (ROAS, Spend, etc.)
-                        numbers = re.findall(r'\d+\.?\d*', card_text)
-                        if numbers:
-                            # ROAS is typically a decimal number (e.g., 2.12)
-                            for num in numbers:
-                                if '.' in num and float(num) < 100:  # ROAS is usually < 100
-                                    roas = num
-                                    break
-                            if not roas and numbers:
-                                roas = numbers[0]  # Fallback to first number
-                    except:
-                        pass
+                if not card_text:
+                    continue
 
-                    # Create row data
-                    row_data = {
-                        "Landing page": landing_page,
-                        "ROAS": roas,
-                        "Card Text": card_text[:100]  # Store first 100 chars for debugging
-                    }
+                # Try to find URL (anchor tag)
+                landing_page = ""
+                if card['anchorText'] is not None:
+                    landing_page = card['href'] or card['anchorText']
+                else:
+                    # Try to extract URL from text
+                    lines = card_text.split('\n')
+                    for line in lines:
+                        if 'http' in line.lower() or '.com' in line.lower() or '.de' in line.lower():
+                            landing_page = line.strip()
+                            break
 
-                    # Debug first few cards
-                    if card_idx < 5:
-                        print(f"[CARD] Card {card_idx}:")
-                        print(f"[CARD]   Landing page: {landing_page[:60] if landing_page else '(not found)'}")
-                        print(f"[CARD]   ROAS: {roas}")
-                        print(f"[CARD]   Text preview: {card_text[:80].replace(chr(10), ' ')}")
+                # Try to find ROAS value (number, possibly with decimal)
+                # ROAS is typically a decimal number below 100 (e.g., 2.12);
+                # fall back to the first number
+                roas = next(
+                    (n for n in numbers if '.' in n and float(n) < 100),
+                    numbers[0] if numbers else ""
+                )
 
-                    # Only add if we found meaningful data
-                    if landing_page or roas:
-                        table_data.append(row_data)
+                # Create row data
+                row_data = {
+                    "Landing page": landing_page,
+                    "ROAS": roas,
+                    "Card Text": card_text[:100]  # Store first 100 chars for debugging
+                }
 
-                except Exception as e:
-                    print(f"[CARD] Card {card_idx} error: {e}")
-                    continue
+                # Debug first few cards
+                if self.debug and card_idx < 5:
+                    print(f"[CARD] Card {card_idx}:")
+                    print(f"[CARD]   Landing page: {landing_page[:60] if landing_page else '(not found)'}")
+                    print(f"[CARD]   ROAS: {roas}")
+                    print(f"[CARD]   Text preview: {card_text[:80].replace(chr(10), ' ')}")
+
+                # Only add if we found meaningful data
+                if landing_page or roas:
+                    table_data.append(row_data)
 
             print(f"[CARD] Successfully extracted {len(table_data)} cards")
 
@@ -1020,6 +1508,170 @@ class AtriaDataExtractor:
 
         return table_data
 
+    # Body rows of every AG Grid column container (pinned left, center, pinned right)
+    AG_BODY_ROW_SELECTOR = (
+        ".ag-pinned-left-cols-container .ag-row[row-index], "
+        ".ag-center-cols-container .ag-row[row-index], "
+        ".ag-pinned-right-cols-container .ag-row[row-index]"
+    )
+
+    # Async JavaScript collecting every AG Grid body row (sorted by row-index) with the
+    # cells from all column containers. AG Grid only renders rows near the viewport, so it
+    # pages .ag-body-viewport down one height every 100ms, merging rows by row-index and
+    # cells by col-id, until the bottom is reached or no new rows appear for 3 steps; then
+    # scrolls back to the top. href/anchorText are null when a cell has no anchor.
+    _JS_COLLECT_GRID_ROWS = """
+    var done = arguments[arguments.length - 1];
+    var rowSelector = arguments[0];
+    var rows = {}, count = 0;
+    var collect = function() {
+        document.querySelectorAll(rowSelector).forEach(function(r) {
+            if (r.offsetParent === null) return;
+            var idx = r.getAttribute('row-index');
+            if (!rows[idx]) { rows[idx] = {cells: [], cols: {}}; count++; }
+            var row = rows[idx];
+            r.querySelectorAll('.ag-cell[col-id]').forEach(function(c) {
+                var col = c.getAttribute('col-id');
+                var a = c.querySelector('a');
+                var cell = {
+                    col: col,
+                    text: c.innerText.trim(),
+                    href: a ? (a.hasAttribute('href') ? a.href : '') : null,
+                    anchorText: a ? a.innerText.trim() : null
+                };
+                if (col in row.cols) { row.cells[row.cols[col]] = cell; }
+                else { row.cols[col] = row.cells.length; row.cells.push(cell); }
+            });
+        });
+    };
+    var finish = function() {
+        done(Object.keys(rows)
+            .sort(function(x, y) { return Number(x) - Number(y); })
+            .map(function(idx) { return {index: idx, cells: rows[idx].cells}; }));
+    };
+    var v = document.querySelector('.ag-body-viewport');
+    if (!v) { collect(); finish(); return; }
+    var last = -1, stable = 0;
+    var step = function() {
+        collect();
+        if (count === last) { stable++; } else { stable = 0; last = count; }
+        if (v.scrollTop + v.clientHeight >= v.scrollHeight || stable > 2) {
+            v.scrollTop = 0;
+            finish();
+            return;
+        }
+        v.scrollTop += v.clientHeight;
+        setTimeout(step, 100);
+    };
+    step();
+    """
+
+    def _extract_grid_via_async_js(self):
+        """
+        Scroll through the AG Grid and read every row and its cells in a single round-trip.
+
+        Returns:
+            list: [{'index': row_index, 'cells': [{'col', 'text', 'href', 'anchorText'}, ...]}, ...]
+        """
+        try:
+            return self.driver.execute_async_script(self._JS_COLLECT_GRID_ROWS, self.AG_BODY_ROW_SELECTOR) or []
+        except Exception as e:
+            print(f"[AG-GRID] JS grid extraction failed: {e}")
+            return []
+
+    # JavaScript reading col-id, text and first anchor (href/text) of a list of AG Grid cells
+    _JS_CELL_INFO = """
+    return arguments[0].map(function(c) {
+        var a = c.querySelector('a');
+        return {
+            col: c.getAttribute('col-id'),
+            text: c.innerText.trim(),
+            href: a ? (a.hasAttribute('href') ? a.href : '') : null,
+            anchorText: a ? a.innerText.trim() : null
+        };
+    });
+    """
+
+    def _extract_rows_via_webdriver(self):
+        """
+        Fallback for _extract_grid_via_async_js: match cells to rows by row-index across all
+        column containers using WebDriver lookups.
+
+        Returns:
+            list: Same shape as _extract_grid_via_async_js
+        """
+        rows = []
+        seen = set()
+        row_elems = self.driver.find_elements(By.CSS_SELECTOR, self.AG_BODY_ROW_SELECTOR)
+        # row-index and displayedness of every row in one round-trip (not 2 calls per row)
+        row_meta = self.driver.execute_script(
+            "return arguments[0].map(function(r) {"
+            " return [r.getAttribute('row-index'), r.offsetParent !== null]; });",
+            row_elems,
+        ) or []
+        for row_index, displayed in row_meta:
+            try:
+                if row_index in seen or not displayed:
+                    continue
+                seen.add(row_index)
+
+                cell_elems = self.driver.find_elements(*_row_cells_locator(row_index))
+                cells = self.driver.execute_script(self._JS_CELL_INFO, cell_elems) or []
+                rows.append({'index': row_index, 'cells': cells})
+            except Exception as e:
+                print(f"[AG-GRID] Fallback row error: {e}")
+                continue
+        return rows
+
+    # JavaScript returning every AG Grid header cell (pinned left, center, pinned right)
+    # as {col, text, visible}; text prefers the .ag-header-cell-text label
+    _JS_AG_HEADERS = """
+    return Array.from(document.querySelectorAll(
+        '.ag-pinned-left-header .ag-header-cell, .ag-header-container .ag-header-cell, .ag-pinned-right-header .ag-header-cell'
+    )).map(function(c) {
+        var t = c.querySelector('.ag-header-cell-text');
+        return {
+            col: c.getAttribute('col-id'),
+            text: (t ? t.innerText : c.innerText).trim(),
+            visible: c.offsetParent !== null
+        };
+    });
+    """
+
+    def _read_ag_headers(self):
+        """Read all AG Grid header cells (col-id, text, visibility) in a single round-trip."""
+        return self.driver.execute_script(self._JS_AG_HEADERS) or []
+
+    # Async JavaScript setting the horizontal scroll position and reporting whether it moved.
+    # AG Grid re-renders its virtual columns from the scroll event within the next frames,
+    # so it finishes after two animation frames; hidden tabs throttle animation frames,
+    # so a 100ms timer caps the wait. Returns true if scrollLeft changed.
+    _JS_SCROLL_AG_COLUMNS = """
+    var viewport = arguments[0], done = arguments[arguments.length - 1];
+    var old = viewport.scrollLeft;
+    viewport.scrollLeft = arguments[1];
+    if (viewport.scrollLeft === old) { done(false); return; }
+    var finished = false;
+    var finish = function() { if (!finished) { finished = true; done(true); } };
+    requestAnimationFrame(function() { requestAnimationFrame(finish); });
+    setTimeout(finish, 100);
+    """
+
+    def _scroll_ag_columns(self, viewport, scroll_left):
+        """
+        Scroll the AG Grid horizontally and read the header cells once the scroll has
+        been rendered (a couple of frames, not a fixed sleep).
+
+        Args:
+            viewport: The .ag-body-horizontal-scroll-viewport element
+            scroll_left: Target scrollLeft in pixels
+
+        Returns:
+            list: Header cells at the new position, as returned by _read_ag_headers
+        """
+        self.driver.execute_async_script(self._JS_SCROLL_AG_COLUMNS, viewport, scroll_left)
+        return self._read_ag_headers()
+
     def _extract_ag_grid_data(self):
         """
         Extract data from AG Grid component.
@@ -1031,34 +1683,22 @@ class AtriaDataExtractor:
         table_data = []
 
         try:
-            time.sleep(2)
+            # Wait for the grid's header cells to render
+            self._wait_until(EC.presence_of_element_located(
+                (By.CSS_SELECTOR, ".ag-root .ag-header-cell[col-id]")
+            ), timeout=5)
 
             # First, scroll to the grid to ensure it's visible
             try:
                 ag_grid = self.driver.find_element(By.CSS_SELECTOR, ".ag-root")
-                print("[AG-GRID] Scrolling to grid...")
-                self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", ag_grid)
-                time.sleep(2)
+                if self._scroll_into_view(ag_grid):
+                    print("[AG-GRID] Scrolled to grid")
             except Exception as e:
                 print(f"[AG-GRID] Scroll error (continuing anyway): {e}")
 
             # Skip Custom columns button - all columns are already visible in the grid
             print("[AG-GRID] Skipping Custom columns button (all columns already visible)")
 
-            # Scroll down within the grid to load all rows (AG Grid uses virtual scrolling)
-            print("[AG-GRID] Scrolling grid to load all rows...")
-            try:
-                # Find the grid body container
-                grid_body = self.driver.find_element(By.CSS_SELECTOR, ".ag-body-viewport")
-                # Scroll to bottom to trigger loading of all rows
-                self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", grid_body)
-                time.sleep(1)
-                # Scroll back to top
-                self.driver.execute_script("arguments[0].scrollTop = 0;", grid_body)
-                time.sleep(1)
-            except Exception as e:
-                print(f"[AG-GRID] Grid scroll error (continuing anyway): {e}")
-
             # Collect headers from all scroll positions (AG Grid uses virtual column scrolling)
             print("[AG-GRID] Collecting headers from all scroll positions...")
             all_collected_headers = []
@@ -1073,41 +1713,28 @@ class AtriaDataExtractor:
                 scroll_positions = [0, max_scroll // 2, max_scroll]  # Left, Middle, Right
 
                 for pos_idx, scroll_pos in enumerate(scroll_positions):
-                    print(f"[AG-GRID] Collecting headers at scroll position {pos_idx+1}/3 (scrollLeft={scroll_pos})...")
-                    self.driver.execute_script(f"arguments[0].scrollLeft = {scroll_pos};", h_scroll_viewport)
-                    time.sleep(1)
-
-                    # Get headers at this position
+                    if self.debug:
+                        print(f"[AG-GRID] Collecting headers at scroll position {pos_idx+1}/3 (scrollLeft={scroll_pos})...")
+                    # Get headers at this position once its columns have rendered
                     try:
-                        header_cells = self.driver.find_elements(By.CSS_SELECTOR, ".ag-header-cell")
-                        for cell in header_cells:
-                            try:
-                                col_id = cell.get_attribute('col-id')
-                                if not col_id or col_id == 'selection':
-                                    continue
+                        for cell in self._scroll_ag_columns(h_scroll_viewport, scroll_pos):
+                            col_id = cell['col']
+                            if not col_id or col_id == 'selection':
+                                continue
 
-                                # Get header text
-                                header_text = ""
-                                try:
-                                    text_elem = cell.find_element(By.CSS_SELECTOR, ".ag-header-cell-text")
-                                    header_text = text_elem.text.strip()
-                                except:
-                                    header_text = cell.text.strip()
-
-                                if header_text and col_id not in all_collected_col_ids:
-                                    all_collected_col_ids[col_id] = header_text
-                                    all_collected_headers.append(header_text)
+                            header_text = cell['text']
+                            if header_text and col_id not in all_collected_col_ids:
+                                all_collected_col_ids[col_id] = header_text
+                                all_collected_headers.append(header_text)
+                                if self.debug:
                                     print(f"[AG-GRID]   Found: '{header_text}' (col-id={col_id})")
-                            except:
-                                continue
                     except Exception as e:
                         print(f"[AG-GRID]   Error at position {pos_idx}: {e}")
 
                 print(f"[AG-GRID] Total unique headers collected: {len(all_collected_headers)}")
 
                 # Keep scrolled to middle for data extraction
-                self.driver.execute_script(f"arguments[0].scrollLeft = {max_scroll // 2};", h_scroll_viewport)
-                time.sleep(1)
+                self._scroll_ag_columns(h_scroll_viewport, max_scroll // 2)
 
             except Exception as e:
                 print(f"[AG-GRID] Header collection error: {e}")
@@ -1120,23 +1747,11 @@ class AtriaDataExtractor:
             if not headers:
                 print("[AG-GRID] WARNING: No headers collected from scroll positions, using fallback method...")
                 try:
-                    all_header_cells = self.driver.find_elements(By.CSS_SELECTOR, ".ag-header-cell")
-                    for idx, cell in enumerate(all_header_cells):
-                        try:
-                            col_id = cell.get_attribute('col-id')
-                            if col_id and col_id not in ['selection', 'ag-Grid-AutoColumn']:
-                                header_text = ""
-                                try:
-                                    text_elem = cell.find_element(By.CSS_SELECTOR, ".ag-header-cell-text")
-                                    header_text = text_elem.text.strip()
-                                except:
-                                    header_text = cell.text.strip()
-
-                                if header_text:
-                                    headers.append(header_text)
-                                    header_positions.append(idx)
-                        except:
-                            continue
+                    for idx, cell in enumerate(self._read_ag_headers()):
+                        col_id = cell['col']
+                        if col_id and col_id not in ['selection', 'ag-Grid-AutoColumn'] and cell['text']:
+                            headers.append(cell['text'])
+                            header_positions.append(idx)
                 except Exception as e:
                     print(f"[AG-GRID] Fallback header extraction error: {e}")
 
@@ -1158,12 +1773,10 @@ class AtriaDataExtractor:
                 'Checkouts Initiated', 'Purchases', 'AOV', 'CPM',
                 'Landing page views', 'CPC (link click)', 'CTR (link click)'
             ]
-            missing_columns = []
-            for expected in expected_columns:
-                # Check if any header contains the expected column name (case insensitive, partial match)
-                found = any(expected.lower() in h.lower() for h in headers)
-                if not found:
-                    missing_columns.append(expected)
+            # Check if any header contains the expected column name (case insensitive, partial match).
+            # Headers are joined once with a separator no column name contains.
+            headers_blob = '|'.join(h.lower() for h in headers)
+            missing_columns = [c for c in expected_columns if c.lower() not in headers_blob]
 
             if missing_columns:
                 print(f"\n" + "!" * 80)
@@ -1184,124 +1797,26 @@ class AtriaDataExtractor:
             # Extract rows from AG Grid
             print("[AG-GRID] Extracting data rows...")
             try:
-                # AG Grid uses multiple column containers
-                # Get row index from one container, then find matching cells in all containers
-                left_rows = self.driver.find_elements(By.CSS_SELECTOR, ".ag-pinned-left-cols-container .ag-row")
-                center_rows = self.driver.find_elements(By.CSS_SELECTOR, ".ag-center-cols-container .ag-row")
-
-                # Use whichever has more rows
-                if len(center_rows) > len(left_rows):
-                    rows = center_rows
-                    print(f"[AG-GRID] Found {len(rows)} rows in center container")
-                else:
-                    rows = left_rows
-                    print(f"[AG-GRID] Found {len(rows)} rows in left container")
+                # Scroll through the grid (AG Grid uses virtual scrolling) collecting every row
+                # with its cells from every column container, in one round-trip
+                print("[AG-GRID] Scrolling grid to load all rows...")
+                rows = self._extract_grid_via_async_js()
+                print(f"[AG-GRID] Found {len(rows)} rows")
 
-                # If no rows in either, try the old way
+                # Fallback: locate cells per row through WebDriver
                 if not rows:
-                    rows = self.driver.find_elements(By.CSS_SELECTOR, ".ag-row")
+                    rows = self._extract_rows_via_webdriver()
                     print(f"[AG-GRID] Found {len(rows)} rows (fallback)")
 
+                # Resolve each col-id to (header, is_landing_page) once, not per cell
+                col_meta = {
+                    col_id: (header, col_id == 'group_key' or 'landing page' in header.lower())
+                    for col_id, header in all_collected_col_ids.items()
+                }
+
                 for row_idx, row in enumerate(rows):
                     try:
-                        if not row.is_displayed():
-                            continue
-
-                        # Get the row-index attribute to match cells across containers
-                        row_index_attr = row.get_attribute("row-index")
-
-                        # Collect all cells for this row from ALL column containers
-                        cells = []
-
-                        # Strategy 1: Use row-index to find matching cells in all containers
-                        if row_index_attr:
-                            try:
-                                # Debug: For first row, check what containers exist
-                                if row_idx == 0:
-                                    containers = []
-                                    if self.driver.find_elements(By.CSS_SELECTOR, ".ag-pinned-left-cols-container"):
-                                        containers.append("left")
-                                    if self.driver.find_elements(By.CSS_SELECTOR, ".ag-center-cols-container"):
-                                        containers.append("center")
-                                    if self.driver.find_elements(By.CSS_SELECTOR, ".ag-pinned-right-cols-container"):
-                                        containers.append("right")
-                                    print(f"[AG-GRID] Available containers: {containers}")
-
-                                # Find cells in pinned-left container
-                                left_cells = self.driver.find_elements(
-                                    By.CSS_SELECTOR,
-                                    f".ag-pinned-left-cols-container .ag-row[row-index='{row_index_attr}'] .ag-cell"
-                                )
-                                # Find cells in center container
-                                center_cells = self.driver.find_elements(
-                                    By.CSS_SELECTOR,
-                                    f".ag-center-cols-container .ag-row[row-index='{row_index_attr}'] .ag-cell"
-                                )
-                                # Find cells in pinned-right container (if exists)
-                                right_cells = self.driver.find_elements(
-                                    By.CSS_SELECTOR,
-                                    f".ag-pinned-right-cols-container .ag-row[row-index='{row_index_attr}'] .ag-cell"
-                                )
-
-                                # Combine all cells
-                                cells = left_cells + center_cells + right_cells
-
-                                if row_idx == 0:
-                                    print(f"[AG-GRID] Strategy 1: found {len(left_cells)} left + {len(center_cells)} center + {len(right_cells)} right = {len(cells)} total cells")
-                                    if len(center_cells) == 0:
-                                        print(f"[AG-GRID] WARNING: Center container has 0 cells! Trying broader selector...")
-                                        # Try without the row-index filter
-                                        try:
-                                            center_all = self.driver.find_elements(By.CSS_SELECTOR, ".ag-center-cols-container .ag-cell")
-                                            print(f"[AG-GRID]          Found {len(center_all)} total cells in center container (all rows)")
-                                        except:
-                                            pass
-                            except Exception as e:
-                                if row_idx == 0:
-                                    print(f"[AG-GRID] Strategy 1 error: {e}")
-
-                        # Strategy 2: If we only found 2 cells, try finding ALL cells with this row-index across entire grid
-                        if len(cells) <= 2:
-                            if row_idx == 0:
-                                print(f"[AG-GRID] Strategy 1 found only {len(cells)} cells, trying Strategy 2 (XPath with row-index)...")
-                            try:
-                                # Find all cells anywhere in grid with this row-index
-                                xpath = f"//div[@row-index='{row_index_attr}']//div[contains(@class, 'ag-cell') and @col-id]"
-                                all_cells = self.driver.find_elements(By.XPATH, xpath)
-                                if len(all_cells) > len(cells):
-                                    cells = all_cells
-                                    if row_idx == 0:
-                                        print(f"[AG-GRID] Strategy 2: found {len(cells)} cells via XPath")
-                            except Exception as e:
-                                if row_idx == 0:
-                                    print(f"[AG-GRID] Strategy 2 error: {e}")
-
-                        # Strategy 3: Find cells by matching Y-position (same vertical position = same row)
-                        if len(cells) <= 2:
-                            if row_idx == 0:
-                                print(f"[AG-GRID] Strategy 2 found only {len(cells)} cells, trying Strategy 3 (Y-position matching)...")
-                            try:
-                                # Get all cells in grid
-                                all_cells_in_grid = self.driver.find_elements(By.CSS_SELECTOR, ".ag-cell[col-id]")
-                                # Get Y position of current row
-                                row_y = row.location['y']
-                                # Filter cells that are at the same Y position (±5px tolerance)
-                                matching_cells = []
-                                for cell in all_cells_in_grid:
-                                    try:
-                                        cell_y = cell.location['y']
-                                        if abs(cell_y - row_y) < 5:  # Same row if Y position is within 5px
-                                            matching_cells.append(cell)
-                                    except:
-                                        continue
-
-                                if len(matching_cells) > len(cells):
-                                    cells = matching_cells
-                                    if row_idx == 0:
-                                        print(f"[AG-GRID] Strategy 3: found {len(cells)} cells by Y-position at y={row_y}")
-                            except Exception as e:
-                                if row_idx == 0:
-                                    print(f"[AG-GRID] Strategy 3 error: {e}")
+                        cells = row['cells']
 
                         if not cells:
                             print(f"[AG-GRID] Row {row_idx}: no cells found")
@@ -1310,10 +1825,10 @@ class AtriaDataExtractor:
                         if row_idx == 0:
                             print(f"[AG-GRID] First row has {len(cells)} cells total")
                             # Debug: show col-id of all cells
-                            for ci, c in enumerate(cells):
-                                col_id = c.get_attribute('col-id') or 'N/A'
-                                text_preview = c.text.strip()[:30] if c.text else '(empty)'
-                                print(f"[AG-GRID]   Cell {ci}: col-id='{col_id}', text='{text_preview}'")
+                            if self.debug:
+                                for ci, c in enumerate(cells):
+                                    text_preview = c['text'][:30] if c['text'] else '(empty)'
+                                    print(f"[AG-GRID]   Cell {ci}: col-id='{c['col'] or 'N/A'}', text='{text_preview}'")
 
                             # Check if cells match headers
                             total_headers = len(headers) + (header_positions[0] if header_positions else 0)
@@ -1328,54 +1843,47 @@ class AtriaDataExtractor:
                         for cell_idx, cell in enumerate(cells):
                             try:
                                 # Get col-id of this cell
-                                col_id = cell.get_attribute('col-id')
+                                col_id = cell['col']
                                 if not col_id or col_id == 'selection':
                                     continue  # Skip checkbox/selection cells
 
                                 # Find matching header for this col-id
-                                header = None
-                                if col_id in all_collected_col_ids:
-                                    header = all_collected_col_ids[col_id]
-
-                                if not header:
-                                    # Fallback: try to map col_id to a header name
+                                meta = col_meta.get(col_id)
+                                if meta is None:
+                                    # Fallback: try to map col_id to a header name (cached, None if unmapped)
                                     col_name = col_id.replace('_', ' ').title()
                                     if col_name in headers:
-                                        header = col_name
+                                        meta = (col_name, col_id == 'group_key' or 'landing page' in col_name.lower())
                                     else:
-                                        if row_idx == 0:
-                                            print(f"[AG-GRID]   Cell {cell_idx}: Skipping unmapped col-id '{col_id}'")
-                                        continue
+                                        meta = (None, False)
+                                    col_meta[col_id] = meta
+
+                                header, is_landing_page = meta
+                                if not header:
+                                    if self.debug and row_idx == 0:
+                                        print(f"[AG-GRID]   Cell {cell_idx}: Skipping unmapped col-id '{col_id}'")
+                                    continue
 
                                 cell_text = ""
 
                                 # Special handling for Landing page column (URL)
-                                if col_id == 'group_key' or 'landing page' in header.lower():
-                                    # Try to extract URL from anchor tag
-                                    try:
-                                        anchor = cell.find_element(By.CSS_SELECTOR, "a")
-                                        href = anchor.get_attribute("href")
-                                        if href:
-                                            cell_text = href
-                                        else:
-                                            cell_text = anchor.text.strip()
-                                    except:
-                                        # No anchor, get text
-                                        cell_text = cell.text.strip()
-
-                                    # Clean up - remove "Used in X ads" text
-                                    if cell_text and "Used in" in cell_text:
-                                        cell_text = cell_text.split("Used in")[0].strip()
-                                    if cell_text and "\n" in cell_text:
-                                        cell_text = cell_text.split("\n")[0].strip()
+                                if is_landing_page:
+                                    # Prefer the anchor's URL, then its text, then the cell text
+                                    if cell['anchorText'] is not None:
+                                        cell_text = cell['href'] or cell['anchorText']
+                                    else:
+                                        cell_text = cell['text']
+
+                                    # Clean up - remove "Used in X ads" text and extra lines
+                                    cell_text = _clean_landing_page(cell_text)
                                 else:
                                     # Regular cell
-                                    cell_text = cell.text.strip()
+                                    cell_text = cell['text']
 
                                 row_data[header] = cell_text
 
                                 # Debug first row
-                                if row_idx < 2:
+                                if self.debug and row_idx < 2:
                                     print(f"[AG-GRID]   Row {row_idx}, col-id '{col_id}' ({header}): '{cell_text[:50] if cell_text else '(empty)'}'")
 
                             except Exception as e:
@@ -1383,7 +1891,7 @@ class AtriaDataExtractor:
                                 continue
 
                         # Only add row if it has data
-                        if row_data and any(v for v in row_data.values()):
+                        if any(row_data.values()):
                             table_data.append(row_data)
 
                     except Exception as e:
@@ -1404,6 +1912,97 @@ class AtriaDataExtractor:
 
         return table_data
 
+    # JavaScript returning every body row of an HTML table as a list of its <td> cells:
+    # {text, title, href, anchorText}; href/anchorText are null when a cell has no anchor
+    _JS_TABLE_ROWS = """
+    var table = arguments[0];
+    var rows = Array.from(table.querySelectorAll('tbody tr'));
+    if (!rows.length) rows = Array.from(table.querySelectorAll('tr')).slice(1);
+    return rows.map(function(r) {
+        return Array.from(r.querySelectorAll('td')).map(function(c) {
+            var a = c.querySelector('a');
+            return {
+                text: c.innerText.trim(),
+                title: c.getAttribute('title'),
+                href: a ? (a.hasAttribute('href') ? a.href : '') : null,
+                anchorText: a ? a.innerText.trim() : null
+            };
+        });
+    });
+    """
+
+    # JavaScript returning the thead row count and the texts of the last header row's
+    # th/td cells (multi-line headers joined with spaces); null when there is no thead
+    _JS_TABLE_HEADERS = """
+    var thead = arguments[0].querySelector('thead');
+    if (!thead) return null;
+    var rows = thead.querySelectorAll('tr');
+    var last = rows[rows.length - 1];
+    return {
+        rows: rows.length,
+        cells: last ? Array.from(last.querySelectorAll('th, td')).map(function(c) {
+            return c.innerText.trim().replace(/\\n/g, ' ');
+        }) : []
+    };
+    """
+
+    def _read_table_rows(self, table):
+        """Read every body row of an HTML table and its cells in a single round-trip."""
+        return self.driver.execute_script(self._JS_TABLE_ROWS, table) or []
+
+    # Candidate table selectors, tried in order until one yields a table scoring above 10
+    TABLE_SELECTORS = (
+        "table",
+        ".ant-table",
+        ".ant-table-container table",
+        "div[class*='table'] table",
+    )
+
+    # JavaScript scoring every candidate table: more rows, non-empty thead headers and tbody
+    # rows score higher. Returns the best table element and its score plus per-table stats
+    # (rows, headers, tbodyRows, score, preview of the first 3 body cells, displayed) per selector.
+    _JS_SCORE_TABLES = """
+    var selectors = arguments[0];
+    var result = {best: null, score: 0, selectors: []};
+    var text = function(e) { return (e.innerText || '').trim(); };
+    for (var s = 0; s < selectors.length; s++) {
+        var stats = [];
+        document.querySelectorAll(selectors[s]).forEach(function(t) {
+            var rows = t.querySelectorAll('tr').length;
+            var thead = t.querySelector('thead');
+            var headers = thead ? Array.from(thead.querySelectorAll('th')).filter(function(th) {
+                return text(th);
+            }).length : 0;
+            var tbody = t.querySelector('tbody');
+            var tbodyRows = tbody ? tbody.querySelectorAll('tr').length : 0;
+            var score = 0;
+            if (rows > 5) score += rows;
+            if (headers > 2) score += 50;
+            if (headers > 5) score += headers * 10;
+            if (tbodyRows > 0) score += 20;
+            if (tbodyRows > 3) score += tbodyRows * 2;
+            var preview = '';
+            if (tbodyRows > 0) {
+                preview = Array.from(tbody.querySelector('tr').querySelectorAll('td')).slice(0, 3)
+                    .map(function(td) { return text(td).slice(0, 20); }).join(' | ');
+            }
+            stats.push({rows: rows, headers: headers, tbodyRows: tbodyRows, score: score, preview: preview,
+                        displayed: !!(t.offsetWidth || t.offsetHeight || t.getClientRects().length)});
+            if (score > result.score && rows > 1) { result.best = t; result.score = score; }
+        });
+        result.selectors.push({selector: selectors[s], tables: stats});
+        if (result.best && result.score > 10) break;
+    }
+    return result;
+    """
+
+    def _ag_grid_displayed(self):
+        """Return True if an AG Grid (.ag-root) is present and rendered, in one round-trip."""
+        return bool(self.driver.execute_script(
+            "var e = document.querySelector('.ag-root');"
+            " return !!(e && (e.offsetWidth || e.offsetHeight || e.getClientRects().length));"
+        ))
+
     def extract_table_data(self):
         """
         Extract all data from the landing pages table.
@@ -1416,127 +2015,66 @@ class AtriaDataExtractor:
         table_data = []
 
         try:
-            time.sleep(3)
+            # DOM parsed is enough (matches the 'eager' load strategy); the rows are awaited below
+            self._wait_until(lambda d: d.execute_script("return document.readyState") != "loading")
 
             # Scroll down the page to ensure data grid is visible (it's below the calendar)
             print("[TABLE] Scrolling page down to reveal data grid...")
             try:
                 self.driver.execute_script("window.scrollTo(0, 500);")
-                time.sleep(2)
+                # Continue as soon as table or AG Grid rows are rendered
+                self._wait_until(EC.any_of(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr")),
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ".ag-row")),
+                ), timeout=5)
             except Exception as e:
                 print(f"[TABLE] Page scroll error (continuing anyway): {e}")
 
+            # Reuse the layout found for the previous report and skip table scoring
+            strategy = self._table_strategy
+            if strategy:
+                print(f"[TABLE] Reusing {strategy['kind']} layout from previous extraction")
+                if strategy['kind'] == 'ag-grid':
+                    data = self._extract_ag_grid_data() if self._ag_grid_displayed() else []
+                else:
+                    data = self._extract_card_data()
+                if data:
+                    return data
+                print("[TABLE] Previous layout returned no data, detecting again...")
+                self._table_strategy = None
+
             # Find the table element
             table = None
 
-            # Try various table selectors
+            # Score every candidate table in one round-trip
             print("[TABLE] Looking for table element...")
-            table_selectors = [
-                ("CSS", "table"),
-                ("CSS", ".ant-table"),
-                ("CSS", ".ant-table-container table"),
-                ("XPATH", "//table"),
-                ("XPATH", "//div[contains(@class, 'table')]//table"),
-            ]
-
-            # Check ALL tables and score them to find the best one
             best_table = None
             best_score = 0
-
-            for selector_type, selector in table_selectors:
-                try:
-                    if selector_type == "CSS":
-                        tables = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    else:
-                        tables = self.driver.find_elements(By.XPATH, selector)
-
-                    print(f"[TABLE] Selector '{selector}': found {len(tables)} tables")
-
-                    for i, t in enumerate(tables):
-                        try:
-                            # Check table quality
-                            rows = t.find_elements(By.CSS_SELECTOR, "tr")
-                            is_displayed = t.is_displayed()
-
-                            # Check headers
-                            has_headers = False
-                            header_count = 0
-                            try:
-                                thead = t.find_element(By.CSS_SELECTOR, "thead")
-                                header_cells = thead.find_elements(By.CSS_SELECTOR, "th")
-                                # Count non-empty headers
-                                for hc in header_cells:
-                                    if hc.text.strip():
-                                        header_count += 1
-                                has_headers = header_count > 2
-                            except:
-                                pass
-
-                            # Check tbody
-                            has_tbody = False
-                            tbody_rows = 0
-                            try:
-                                tbody = t.find_element(By.CSS_SELECTOR, "tbody")
-                                tbody_rows = len(tbody.find_elements(By.CSS_SELECTOR, "tr"))
-                                has_tbody = tbody_rows > 0
-                            except:
-                                pass
-
-                            # Score the table
-                            score = 0
-                            if len(rows) > 5:  # More rows = better
-                                score += len(rows)
-                            if has_headers:
-                                score += 50  # Bonus for having headers
-                            if header_count > 5:
-                                score += header_count * 10  # More headers = better
-                            if has_tbody:
-                                score += 20
-                            if tbody_rows > 3:
-                                score += tbody_rows * 2
-
-                            # Debug: show first few cells of first row
-                            first_row_preview = ""
-                            try:
-                                if tbody_rows > 0:
-                                    first_row = tbody.find_element(By.CSS_SELECTOR, "tr")
-                                    first_cells = first_row.find_elements(By.CSS_SELECTOR, "td")
-                                    cell_texts = [c.text.strip()[:20] for c in first_cells[:3]]
-                                    first_row_preview = " | ".join(cell_texts)
-                            except:
-                                pass
-
-                            print(f"[TABLE]   Table {i}: rows={len(rows)}, headers={header_count}, tbody_rows={tbody_rows}, score={score}, preview='{first_row_preview}'")
-
-                            # Update best table if this one is better
-                            if score > best_score and len(rows) > 1:
-                                best_score = score
-                                best_table = t
-                                print(f"[TABLE]   -> New best table (score={score})")
-
-                        except Exception as e:
-                            print(f"[TABLE]   Table {i} check error: {e}")
-                            continue
-
-                    # If we found a good table (score > 10), use it
-                    if best_table and best_score > 10:
-                        table = best_table
-                        print(f"[TABLE] Selected best table with score {best_score}")
-                        break
-
-                except Exception as e:
-                    print(f"[TABLE] Selector '{selector}' failed: {e}")
-                    continue
+            try:
+                result = self.driver.execute_script(self._JS_SCORE_TABLES, list(self.TABLE_SELECTORS))
+                for candidate in result['selectors']:
+                    print(f"[TABLE] Selector '{candidate['selector']}': found {len(candidate['tables'])} tables")
+                    if self.debug:
+                        for i, t in enumerate(candidate['tables']):
+                            print(f"[TABLE]   Table {i}: rows={t['rows']}, headers={t['headers']}, tbody_rows={t['tbodyRows']}, score={t['score']}, displayed={t['displayed']}, preview='{t['preview']}'")
+                best_table = result['best']
+                best_score = result['score']
+                # Use the best table only if it is good enough (score > 10)
+                if best_table and best_score > 10:
+                    table = best_table
+                    print(f"[TABLE] Selected best table with score {best_score}")
+            except Exception as e:
+                print(f"[TABLE] Table scoring failed: {e}")
 
             # If we found a table but it has a low score, try AG Grid first
             if table and best_score < 50:
                 print(f"[TABLE] Found table but quality is low (score={best_score}), trying AG Grid first...")
                 try:
-                    ag_grid = self.driver.find_element(By.CSS_SELECTOR, ".ag-root")
-                    if ag_grid and ag_grid.is_displayed():
+                    if self._ag_grid_displayed():
                         print("[TABLE] Found AG Grid, using it instead of low-quality table")
                         ag_data = self._extract_ag_grid_data()
                         if ag_data and len(ag_data) > 0:
+                            self._table_strategy = {'kind': 'ag-grid'}
                             return ag_data
                         else:
                             print("[TABLE] AG Grid returned no data, falling back to table")
@@ -1546,9 +2084,8 @@ class AtriaDataExtractor:
             # If we found a table, scroll to it to ensure it's visible
             if table:
                 try:
-                    print("[TABLE] Scrolling to table...")
-                    self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", table)
-                    time.sleep(2)
+                    if self._scroll_into_view(table):
+                        print("[TABLE] Scrolled to table")
                 except Exception as e:
                     print(f"[TABLE] Scroll error (continuing anyway): {e}")
 
@@ -1556,11 +2093,11 @@ class AtriaDataExtractor:
                 print("[TABLE] Standard table not found, checking for AG Grid...")
                 # Try AG Grid extraction
                 try:
-                    ag_grid = self.driver.find_element(By.CSS_SELECTOR, ".ag-root")
-                    if ag_grid and ag_grid.is_displayed():
+                    if self._ag_grid_displayed():
                         print("[TABLE] Found AG Grid, extracting data...")
                         ag_data = self._extract_ag_grid_data()
                         if ag_data:
+                            self._table_strategy = {'kind': 'ag-grid'}
                             return ag_data
                         else:
                             print("[TABLE] AG Grid extraction returned no data, trying card-based extraction...")
@@ -1572,53 +2109,52 @@ class AtriaDataExtractor:
                 try:
                     card_data = self._extract_card_data()
                     if card_data:
+                        self._table_strategy = {'kind': 'cards'}
                         return card_data
                 except Exception as e:
                     print(f"[TABLE] Card extraction failed: {e}")
 
                 print("[TABLE] ERROR: Could not find table, AG Grid, or card-based data")
-                # Debug: show what's on the page
-                print("[TABLE] Debug - looking for any table-like elements...")
-                try:
-                    all_tables = self.driver.find_elements(By.XPATH, "//*[contains(@class, 'table')]")
-                    for i, t in enumerate(all_tables[:10]):
-                        print(f"[TABLE]   Element {i}: tag={t.tag_name}, class='{t.get_attribute('class')[:40] if t.get_attribute('class') else ''}'")
-                except:
-                    pass
+                if self.debug:
+                    # Debug: show what's on the page
+                    print("[TABLE] Debug - looking for any table-like elements...")
+                    try:
+                        # Tag and class of the first 10 matches in one round-trip
+                        all_tables = self.driver.execute_script("""
+                            return Array.from(document.querySelectorAll("[class*='table']")).slice(0, 10)
+                                .map(function(e) { return {tag: e.tagName.toLowerCase(), cls: e.getAttribute('class') || ''}; });
+                        """) or []
+                        for i, t in enumerate(all_tables):
+                            print(f"[TABLE]   Element {i}: tag={t['tag']}, class='{t['cls'][:40]}'")
+                    except:
+                        pass
                 return []
 
             # Extract headers - ALWAYS extract from page first, then verify
             headers = []
             print("[TABLE] Extracting headers...")
 
-            # Try to find header row in thead
+            # Read the header row texts from thead in one round-trip
             try:
-                thead = table.find_element(By.CSS_SELECTOR, "thead")
-                header_rows = thead.find_elements(By.CSS_SELECTOR, "tr")
-                print(f"[TABLE] Found {len(header_rows)} header rows in thead")
-
-                # Use the last header row (sometimes there are multiple)
-                header_row = header_rows[-1] if header_rows else None
-                if header_row:
-                    header_cells = header_row.find_elements(By.CSS_SELECTOR, "th, td")
-                    print(f"[TABLE] Found {len(header_cells)} header cells")
-
-                    for idx, cell in enumerate(header_cells):
-                        try:
-                            # Get text, handling multi-line headers
-                            text = cell.text.strip().replace('\n', ' ')
-                            # Skip empty headers (likely checkbox column)
-                            if text:
-                                headers.append(text)
-                            else:
-                                # Check if it's a checkbox column (first column, empty)
-                                if idx == 0:
-                                    print(f"[TABLE]   Header {idx}: (empty - likely checkbox)")
-                                else:
-                                    headers.append(f"Column_{idx}")
-                            print(f"[TABLE]   Header {idx}: '{text if text else '(empty)'}'")
-                        except:
-                            continue
+                header_info = self.driver.execute_script(self._JS_TABLE_HEADERS, table)
+                if header_info is None:
+                    raise ValueError("table has no thead")
+                print(f"[TABLE] Found {header_info['rows']} header rows in thead")
+                print(f"[TABLE] Found {len(header_info['cells'])} header cells")
+
+                for idx, text in enumerate(header_info['cells']):
+                    # Skip empty headers (likely checkbox column)
+                    if text:
+                        headers.append(text)
+                    else:
+                        # Check if it's a checkbox column (first column, empty)
+                        if idx == 0:
+                            if self.debug:
+                                print(f"[TABLE]   Header {idx}: (empty - likely checkbox)")
+                        else:
+                            headers.append(f"Column_{idx}")
+                    if self.debug:
+                        print(f"[TABLE]   Header {idx}: '{text if text else '(empty)'}'")
             except Exception as e:
                 print(f"[TABLE] Header extraction from thead error: {e}")
 
@@ -1657,40 +2193,41 @@ class AtriaDataExtractor:
             for i, h in enumerate(headers):
                 print(f"[TABLE]   [{i}] {h}")
 
-            # Extract rows
+            # Extract rows (all rows and cells in one round-trip)
             print("[TABLE] Extracting data rows...")
             try:
-                rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
-                if not rows:
-                    rows = table.find_elements(By.XPATH, ".//tr[position() > 1]")
+                rows = self._read_table_rows(table)
                 print(f"[TABLE] Found {len(rows)} rows")
             except Exception as e:
                 print(f"[TABLE] Row extraction error: {e}")
                 rows = []
 
-            for row_idx, row in enumerate(rows):
+            n_headers = len(headers)
+
+            # Header for every cell position, with Column_N names for cells past the headers
+            max_cells = max(map(len, rows), default=0)
+            headers_expanded = headers + [f"Column_{i}" for i in range(n_headers, max_cells)]
+
+            for row_idx, cells in enumerate(rows):
                 try:
-                    cells = row.find_elements(By.CSS_SELECTOR, "td")
                     if not cells:
                         continue
 
                     # Debug: print cell count for first row
                     if row_idx == 0:
-                        print(f"[TABLE] First row has {len(cells)} cells, we have {len(headers)} headers")
+                        print(f"[TABLE] First row has {len(cells)} cells, we have {n_headers} headers")
                         # Print first few cell contents for debugging
-                        for ci, c in enumerate(cells[:5]):
-                            try:
-                                txt = c.text.strip()[:30] if c.text else "(empty)"
+                        if self.debug:
+                            for ci, c in enumerate(cells[:5]):
+                                txt = c['text'][:30] if c['text'] else "(empty)"
                                 print(f"[TABLE]   Cell {ci}: '{txt}'")
-                            except:
-                                pass
 
                     # Check if we need to skip the first cell (checkbox column)
                     # If first cell is empty or very short (just checkbox), skip it
                     cell_offset = 0
-                    if len(cells) > len(headers):
+                    if len(cells) > n_headers:
                         # More cells than headers - likely a checkbox column
-                        first_cell_text = cells[0].text.strip() if cells[0].text else ""
+                        first_cell_text = cells[0]['text']
                         # Check if first cell looks like a checkbox (empty or very short)
                         if len(first_cell_text) < 3 or first_cell_text.isdigit():
                             cell_offset = 1
@@ -1698,58 +2235,34 @@ class AtriaDataExtractor:
 
                     row_data = {}
 
-                    for i, cell in enumerate(cells[cell_offset:]):  # Skip checkbox cell if needed
-                        try:
-                            header = headers[i] if i < len(headers) else f"Column_{i}"
+                    for i, cell in enumerate(islice(cells, cell_offset, None)):  # Skip checkbox cell if needed
+                        header = headers_expanded[i]
 
-                            # Special handling for first data column (Landing page) - extract URL from anchor
-                            if i == 0:
-                                # Try to find anchor tag with URL
-                                cell_text = ""
-                                try:
-                                    anchor = cell.find_element(By.CSS_SELECTOR, "a")
-                                    href = anchor.get_attribute("href")
-                                    if href:
-                                        cell_text = href
-                                    else:
-                                        cell_text = anchor.text.strip()
-                                except:
-                                    # No anchor, try getting text or title
-                                    cell_text = cell.get_attribute("title") or cell.text.strip()
-                                    # Also check for nested anchor
-                                    try:
-                                        nested_a = cell.find_element(By.XPATH, ".//a[@href]")
-                                        if nested_a:
-                                            href = nested_a.get_attribute("href")
-                                            if href:
-                                                cell_text = href
-                                    except:
-                                        pass
-
-                                # Clean up - remove "Used in X ads" text
-                                if cell_text and "Used in" in cell_text:
-                                    cell_text = cell_text.split("Used in")[0].strip()
-                                if cell_text and "\n" in cell_text:
-                                    cell_text = cell_text.split("\n")[0].strip()
+                        # Special handling for first data column (Landing page) - prefer the anchor URL
+                        if i == 0:
+                            if cell['anchorText'] is not None:
+                                cell_text = cell['href'] or cell['anchorText']
                             else:
-                                cell_text = cell.text.strip()
+                                # No anchor, use title or text
+                                cell_text = cell['title'] or cell['text']
 
-                            row_data[header] = cell_text
-                        except Exception as e:
-                            print(f"[TABLE] Cell {i} error: {e}")
-                            continue
+                            # Clean up - remove "Used in X ads" text and extra lines
+                            cell_text = _clean_landing_page(cell_text)
+                        else:
+                            cell_text = cell['text']
+
+                        row_data[header] = cell_text
 
                     # Debug: print first few rows with all their data
-                    if row_idx < 3:
+                    if self.debug and row_idx < 3:
                         lp = row_data.get('Landing page', 'N/A')
                         spend = row_data.get('Spend', 'N/A')
                         clicks = row_data.get('Link clicks', 'N/A')
                         print(f"[TABLE]   Row {row_idx}: Landing page='{lp[:50] if lp else 'N/A'}', Spend={spend}, Link clicks={clicks}")
 
-                    if row_data and any(v for v in row_data.values()):
+                    if any(row_data.values()):
                         # Skip if it's a "Net Results" summary row
-                        first_value = list(row_data.values())[0] if row_data else ""
-                        if "Net Results" not in str(first_value):
+                        if "Net Results" not in row_data.get(headers[0], ""):
                             table_data.append(row_data)
                 except Exception as e:
                     print(f"[TABLE] Row {row_idx} extraction error: {e}")
@@ -1764,6 +2277,148 @@ class AtriaDataExtractor:
 
         return table_data
 
+    def extract_report(self, report_num, target_date):
+        """
+        Run the full extraction for one report: navigate, set date, wait, extract.
+
+        Args:
+            report_num: 1 for first report, 2 for second report
+            target_date: datetime object for the date to select
+
+        Returns:
+            list: List of dictionaries containing row data ([] if login failed)
+        """
+        return self.extract_report_dates(report_num, [target_date]).get(target_date, [])
+
+    def extract_report_dates(self, report_num, target_dates):
+        """
+        Extract one report for several dates in the same page session: the report is
+        loaded once, then only the date range is changed for each date.
+
+        Args:
+            report_num: 1 for first report, 2 for second report
+            target_dates: Iterable of datetime objects
+
+        Returns:
+            dict: {target_date: list of row dictionaries} ({} if login failed)
+        """
+        self.navigate_to_report(report_num)
+        if not self.check_and_wait_for_login(report_num):
+            print(f"[REPORT {report_num}] Login failed or timed out")
+            return {}
+
+        results = {}
+        for target_date in dict.fromkeys(target_dates):
+            # After the first date the table still shows the previous date's rows
+            if results:
+                self.change_date(target_date)
+            else:
+                self.set_date(target_date)
+            self.wait_for_data_load()
+            results[target_date] = self.extract_table_data()
+        return results
+
+    def extract_many(self, report_num, target_dates):
+        """
+        Extract one report for several dates using one tab per date in this browser.
+
+        The first date uses the current tab (which also handles login); the other tabs
+        load in the background meanwhile. Every tab gets its date set before any table
+        is read, so the report queries for all dates run in the browser at the same time.
+        Every tab other than the current one is closed afterwards, also on errors.
+
+        Args:
+            report_num: 1 for first report, 2 for second report
+            target_dates: Iterable of datetime objects
+
+        Returns:
+            dict: {target_date: list of row dictionaries} ({} if login failed)
+        """
+        # Each date once (a repeated date would only open a tab for the same dict key)
+        target_dates = list(dict.fromkeys(target_dates))
+        if not target_dates:
+            return {}
+
+        self.navigate_to_report(report_num)
+        if not self.check_and_wait_for_login(report_num):
+            print(f"[REPORT {report_num}] Login failed or timed out")
+            return {}
+
+        main_handle = self.driver.current_window_handle
+        results = {}
+        try:
+            handles = [main_handle] + [self.open_report_tab(report_num) for _ in target_dates[1:]]
+            tabs = [(d, h) for d, h in zip(target_dates, handles) if h]
+
+            # Pass 1: set the date in every tab, so each report starts loading its data
+            for target_date, handle in tabs:
+                print(f"[REPORT {report_num}] Setting {target_date.strftime('%d-%b-%Y')} in its own tab...")
+                self.switch_to_report_tab(handle)
+                self.set_date(target_date)
+
+            # Pass 2: read each tab's table (every load was started in pass 1)
+            for target_date, handle in tabs:
+                self._element_cache.clear()
+                self.driver.switch_to.window(handle)
+                self.wait_for_data_load(expect_loader=False)
+                results[target_date] = self.extract_table_data()
+        finally:
+            # Back to the main tab with every other tab closed, even if a pass failed
+            self._element_cache.clear()
+            _close_other_tabs(self.driver, main_handle)
+
+        # Dates whose tab could not be opened are extracted in the main tab (which already
+        # shows the first date's rows)
+        for target_date in target_dates:
+            if target_date not in results:
+                self.change_date(target_date)
+                self.wait_for_data_load()
+                results[target_date] = self.extract_table_data()
+        return results
+
+    @staticmethod
+    def _create_driver(driver_factory, attempts=3):
+        """Create a WebDriver, retrying when chromedriver fails to bind its local port."""
+        for attempt in range(1, attempts + 1):
+            try:
+                return driver_factory()
+            except Exception as e:
+                if attempt == attempts:
+                    raise
+                print(f"[PARALLEL] Driver start failed (attempt {attempt}/{attempts}): {e}")
+                time.sleep(1)
+
+    @classmethod
+    def extract_both(cls, driver_factory, target_date):
+        """
+        Extract report 1 and report 2 concurrently in two separate browser sessions.
+
+        The factory must return independent sessions (e.g. separate Chrome profile
+        directories and debugging ports), since each report drives its own browser.
+        Each driver is quit once its report is extracted.
+
+        Args:
+            driver_factory: Callable returning a new, logged-in WebDriver
+            target_date: datetime object for the date to select
+
+        Returns:
+            tuple: (report_1_data, report_2_data)
+        """
+        def run(report_num):
+            driver = cls._create_driver(driver_factory)
+            try:
+                return cls(driver).extract_report(report_num, target_date)
+            finally:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            future_1 = pool.submit(run, 1)
+            future_2 = pool.submit(run, 2)
+            return future_1.result(), future_2.result()
+
     def display_data(self, data):
         """
         Display extracted data to console.
@@ -1775,22 +2430,72 @@ class AtriaDataExtractor:
             print("\nNo data to display")
             return
 
-        print("\n" + "=" * 100)
-        print("EXTRACTED LANDING PAGE DATA")
-        print("=" * 100)
+        lines = ["\n" + "=" * 100, "EXTRACTED LANDING PAGE DATA", "=" * 100]
 
         # Display each row with Landing page URL prominently
         for i, row in enumerate(data):
-            landing_page = row.get('Landing page', 'N/A')
-            print(f"\n[{i+1}] URL: {landing_page}")
-            print("    Data:")
-            for key, value in row.items():
-                if key != 'Landing page':
-                    print(f"      {key}: {value}")
+            lines.append(f"\n[{i+1}] URL: {row.get('Landing page', 'N/A')}")
+            lines.append("    Data:")
+            lines.extend(f"      {key}: {value}" for key, value in row.items() if key != 'Landing page')
+
+        lines += ["\n" + "=" * 100, f"Total rows: {len(data)}", "=" * 100]
+
+        # One write for the whole report instead of a print per line
+        print("\n".join(lines))
+
+
+def _open_add_tracker_spreadsheet():
+    """Authorize with Google Sheets and open the Daily Add Tracker spreadsheet."""
+    from services.sheets.add_tracker_helpers import get_daily_add_tracker_spreadsheet
+    return get_daily_add_tracker_spreadsheet()
+
+
+# BrowserManager kept open by the runner when KEEP_BROWSER is set
+_kept_manager = None
+
 
-        print("\n" + "=" * 100)
-        print(f"Total rows: {len(data)}")
-        print("=" * 100)
+def _close_other_tabs(driver, keep_handle):
+    """Close every browser tab except keep_handle and switch back to it."""
+    for handle in driver.window_handles:
+        if handle != keep_handle:
+            driver.switch_to.window(handle)
+            driver.close()
+    driver.switch_to.window(keep_handle)
+
+
+def _start_runner_browser():
+    """
+    Start the runner's browser, or reuse the kept one while its session is alive.
+
+    Returns:
+        tuple: (BrowserManager, WebDriver)
+    """
+    global _kept_manager
+    from browser_manager import BrowserManager
+
+    if KEEP_BROWSER and _kept_manager and _kept_manager.driver:
+        try:
+            # Start from the first tab only (raises once the session is gone)
+            _close_other_tabs(_kept_manager.driver, _kept_manager.driver.window_handles[0])
+            print("Reusing the open Atria browser session...")
+            return _kept_manager, _kept_manager.driver
+        except Exception:
+            _kept_manager.close()
+            _kept_manager = None
+
+    manager = BrowserManager(use_existing_chrome=False)
+    # Atria keeps loading data after DOMContentLoaded; navigate_to_report waits for the picker
+    driver = manager.start_browser(page_load_strategy='eager')
+    if KEEP_BROWSER:
+        _kept_manager = manager
+    return manager, driver
+
+
+@atexit.register
+def _close_kept_browser():
+    """Quit the kept browser when the process exits."""
+    if _kept_manager:
+        _kept_manager.close()
 
 
 def run_add_tracker_report(date_obj, date_str):
@@ -1804,6 +2509,9 @@ def run_add_tracker_report(date_obj, date_str):
     Returns:
         bool: True if successful, False otherwise
     """
+    global _kept_manager
+    spreadsheet_future = None
+
     print("\n\n")
     print("=" * 80)
     print("ADD TRACKER REPORT".center(80))
@@ -1814,8 +2522,7 @@ def run_add_tracker_report(date_obj, date_str):
         import time
 
         print("[1/9] Opening browser...")
-        manager = BrowserManager(use_existing_chrome=False)
-        driver = manager.start_browser()
+        manager, driver = _start_runner_browser()
 
         extractor = AtriaDataExtractor(driver)
 
@@ -1830,16 +2537,16 @@ def run_add_tracker_report(date_obj, date_str):
         extractor.navigate_to_report(1)
 
         # Check if login is needed - restart browser in visible mode if so
-        current_url = driver.current_url.lower()
-        if "login" in current_url or "sign" in current_url or "auth" in current_url:
+        if extractor._on_login_page():
             print("\n⚠️  Atria login required - restarting browser in visible mode...")
             manager.close()
+            if manager is _kept_manager:
+                _kept_manager = None
             time.sleep(2)
             manager = BrowserManager(use_existing_chrome=False)
-            driver = manager.start_browser(headless=False)
+            driver = manager.start_browser(headless=False, page_load_strategy='eager')
             extractor = AtriaDataExtractor(driver)
             extractor.navigate_to_report(1)
-            time.sleep(3)
             if not extractor.check_and_wait_for_login():
                 print("Login failed or timed out")
                 manager.close()
@@ -1847,57 +2554,86 @@ def run_add_tracker_report(date_obj, date_str):
         elif not extractor.check_and_wait_for_login():
             print("Login failed or timed out")
             manager.close()
+            if manager is _kept_manager:
+                _kept_manager = None
             return False
 
-        print("[3/9] Setting date for report 1...")
-        extractor.set_date(date_obj)
+        # Open the spreadsheet (auth + lookup) in the background while both reports are
+        # extracted; only started once logged in, so failed runs do not authorize for nothing
+        sheets_pool = ThreadPoolExecutor(max_workers=1)
+        spreadsheet_future = sheets_pool.submit(_open_add_tracker_spreadsheet)
+        sheets_pool.shutdown(wait=False)
 
-        print("[4/9] Waiting for data to load...")
-        extractor.wait_for_data_load()
-
-        print("[5/9] Extracting table data from report 1...")
-        data_report_1 = extractor.extract_table_data()
-
-        # Display data on console for verification
-        print("\n*** REPORT 1 DATA ***")
-        extractor.display_data(data_report_1)
-
-        # =====================================================================
-        # REPORT 2
-        # =====================================================================
-        print("\n" + "-" * 60)
-        print("REPORT 2: Second Report")
-        print("-" * 60)
+        # Report 2 loads in a second tab while report 1 is being worked on
+        report_1_tab = driver.current_window_handle
+        try:
+            report_2_tab = extractor.open_report_tab(2)
 
-        print("[6/9] Navigating to Atria report 2...")
-        extractor.navigate_to_report(2)
-        time.sleep(3)
+            print("[3/9] Setting date for report 1...")
+            extractor.set_date(date_obj)
 
-        print("[7/9] Setting date for report 2...")
-        extractor.set_date(date_obj)
+            # Set report 2's date before reading report 1, so both reports load their data at once
+            if report_2_tab:
+                print("[4/9] Setting date for report 2 in its tab...")
+                extractor.switch_to_report_tab(report_2_tab)
+                extractor.set_date(date_obj)
+                extractor.switch_to_report_tab(report_1_tab)
 
-        print("[8/9] Waiting for data to load...")
-        extractor.wait_for_data_load()
+            print("[5/9] Waiting for data to load...")
+            extractor.wait_for_data_load()
 
-        print("Extracting table data from report 2...")
-        data_report_2 = extractor.extract_table_data()
+            print("[6/9] Extracting table data from report 1...")
+            data_report_1 = extractor.extract_table_data()
 
-        # Display data on console for verification
-        print("\n*** REPORT 2 DATA ***")
-        extractor.display_data(data_report_2)
+            # Display data on console for verification
+            print("\n*** REPORT 1 DATA ***")
+            extractor.display_data(data_report_1)
 
-        # =====================================================================
-        # SUMMARY
-        # =====================================================================
-        print("\n" + "=" * 80)
-        print("EXTRACTION SUMMARY")
-        print("=" * 80)
-        print(f"Report 1: {len(data_report_1)} rows extracted")
-        print(f"Report 2: {len(data_report_2)} rows extracted")
-        print("=" * 80)
+            # =====================================================================
+            # REPORT 2
+            # =====================================================================
+            print("\n" + "-" * 60)
+            print("REPORT 2: Second Report")
+            print("-" * 60)
 
-        # Close browser
-        manager.close()
+            if report_2_tab:
+                extractor.switch_to_report_tab(report_2_tab)
+            else:
+                print("[7/9] Navigating to Atria report 2 and setting its date...")
+                extractor.navigate_to_report(2)
+                extractor.set_date(date_obj)
+
+            print("[8/9] Waiting for data to load...")
+            # In its own tab, report 2 has been loading since step 4
+            extractor.wait_for_data_load(expect_loader=not report_2_tab)
+
+            print("Extracting table data from report 2...")
+            data_report_2 = extractor.extract_table_data()
+
+            # Display data on console for verification
+            print("\n*** REPORT 2 DATA ***")
+            extractor.display_data(data_report_2)
+
+            # =====================================================================
+            # SUMMARY
+            # =====================================================================
+            print("\n" + "=" * 80)
+            print("EXTRACTION SUMMARY")
+            print("=" * 80)
+            print(f"Report 1: {len(data_report_1)} rows extracted")
+            print(f"Report 2: {len(data_report_2)} rows extracted")
+            print("=" * 80)
+        finally:
+            # Close browser (a kept session only drops its extra tabs, or is quit if that fails)
+            if KEEP_BROWSER and manager is _kept_manager:
+                try:
+                    _close_other_tabs(driver, report_1_tab)
+                except Exception as e:
+                    print(f"Could not reset the kept browser ({e}), closing it...")
+                    manager.close()
+                    _kept_manager = None
+            else:
+                manager.close()
 
         # =====================================================================
         # WRITE TO GOOGLE SHEETS
@@ -1905,7 +2641,12 @@ def run_add_tracker_report(date_obj, date_str):
         print("\n[9/9] Writing to Google Sheets...")
         try:
             from services.sheets.add_tracker_helpers import write_atria_data_to_sheets
-            write_atria_data_to_sheets(date_obj, data_report_1, data_report_2)
+            try:
+                spreadsheet = spreadsheet_future.result()
+            except Exception as e:
+                print(f"  Could not open spreadsheet in the background ({e}), retrying...")
+                spreadsheet = None
+            write_atria_data_to_sheets(date_obj, data_report_1, data_report_2, spreadsheet=spreadsheet)
             print("  Successfully wrote to Google Sheets!")
         except Exception as e:
             print(f"  Warning: Could not write to Google Sheets: {e}")
@@ -1923,6 +2664,9 @@ def run_add_tracker_report(date_obj, date_str):
         print(f"\nAdd Tracker Report failed: {e}")
         import traceback
         traceback.print_exc()
+        # The sheet is not written: drop the spreadsheet lookup if it has not started yet
+        if spreadsheet_future:
+            spreadsheet_future.cancel()
         return False
 
 
@@ -95,8 +95,14 @@ class BrowserManager:
         if not os.path.exists(self.profile_dir):
             os.makedirs(self.profile_dir)
 
-    def start_browser(self, headless=None):
-        """Start Chrome browser. If headless is None, reads HEADLESS_MODE env var (default: True)."""
+    def start_browser(self, headless=None, page_load_strategy=None):
+        """
+        Start Chrome browser. If headless is None, reads HEADLESS_MODE env var (default: True).
+
+        page_load_strategy: Optional WebDriver page load strategy ('normal', 'eager', 'none').
+        'eager' makes driver.get() return at DOMContentLoaded instead of waiting for every
+        resource, for callers that wait for the elements they need themselves.
+        """
         if headless is None:
             headless = os.environ.get("HEADLESS_MODE", "1") != "0"
         
@@ -132,6 +138,9 @@ class BrowserManager:
             chrome_options.add_argument("--disable-gpu")
         else:
             print("Starting Chrome in visible mode...")
+
+        if page_load_strategy:
+            chrome_options.page_load_strategy = page_load_strategy
         
         self._connected_to_existing = False
         
@@ -672,7 +672,8 @@ def write_data_to_daily_sheet(worksheet, row_num: int, column_data: Dict[int, an
         raise
 
 
-def write_atria_data_to_sheets(date_obj: datetime, atria_data_report1: List[Dict], atria_data_report2: List[Dict] = None):
+def write_atria_data_to_sheets(date_obj: datetime, atria_data_report1: List[Dict], atria_data_report2: List[Dict] = None,
+                               spreadsheet: Optional[gspread.Spreadsheet] = None):
     """
     Main function to write Atria data to all DAILY sheets.
 
@@ -680,6 +681,7 @@ def write_atria_data_to_sheets(date_obj: datetime, atria_data_report1: List[Dict
         date_obj: datetime object for the date being processed
         atria_data_report1: List of dictionaries from Atria Report 1
         atria_data_report2: List of dictionaries from Atria Report 2 (optional)
+        spreadsheet: Already opened Daily Add Tracker spreadsheet (optional, opened here if None)
     """
     print("\n[DAILY ADD TRACKER] Writing data to Google Sheets...")
     print(f"  Target date: {date_obj.strftime('%d %B %Y')}")
@@ -713,7 +715,8 @@ def write_atria_data_to_sheets(date_obj: datetime, atria_data_report1: List[Dict
         print("=" * 80)
 
         # Get spreadsheet
-        spreadsheet = get_daily_add_tracker_spreadsheet()
+        if spreadsheet is None:
+            spreadsheet = get_daily_add_tracker_spreadsheet()
         print(f"\n  Opened spreadsheet: {spreadsheet.title}")
 
         # Get all DAILY worksheets